@@ -1,18 +1,56 @@
 from shiny import App, ui, render, reactive
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-import os
+import matplotlib
+matplotlib.use("Agg")  # Headless server: never probe for a GUI backend
+import html
+import io
 import random
+import tempfile
 import time
+from collections import OrderedDict
+from functools import lru_cache
+from matplotlib.layout_engine import TightLayoutEngine
 
 # Import the demonstration modules
-from modules.law_of_large_numbers import demonstrate_law_of_large_numbers
-from modules.risk_pooling import demonstrate_risk_pooling
-from modules.balance_sheet import demonstrate_balance_sheet
-from modules.premium_calculation import demonstrate_premium_calculation
-from modules.capital_role import demonstrate_capital_role
+from modules.law_of_large_numbers import compute_law_of_large_numbers, plot_law_of_large_numbers
+from modules.risk_pooling import compute_risk_pooling, plot_risk_pooling, CLAIM_AMOUNT
+from modules.balance_sheet import compute_balance_sheet, plot_balance_sheet, PREMIUM_REVENUE, MIN_CAPITAL_RATIO
+from modules.premium_calculation import (compute_premium_calculation, plot_premium_calculation,
+                                         EXPENSE_RATIO, RISK_MARGIN_RATIO)
+from modules.capital_role import compute_capital_role, plot_capital_role, ANNUAL_PREMIUM
+from modules.plotting import release_artists
+
+# Slider ranges and starting values, shared by the UI and the cache prewarm below
+SLIDERS = {
+    "true_probability": dict(min=0.01, max=0.25, value=0.05, step=0.02),
+    "accident_probability": dict(min=0.01, max=0.25, value=0.05, step=0.02),
+    "num_policyholders": dict(min=10, max=1000, value=100, step=10),
+    "loss_ratio": dict(min=0.40, max=1.0, value=0.65, step=0.05),
+    "accident_frequency": dict(min=0.01, max=0.20, value=0.05, step=0.01),
+    "claim_severity": dict(min=2000, max=20000, value=8000, step=1000),
+    "capital_amount": dict(min=10, max=100, value=50, step=10),
+    "num_years": dict(min=5, max=100, value=10, step=5),
+}
+
+
+def slider_values(name):
+    """Every value a slider can send, rounded the way the browser reports them."""
+    slider = SLIDERS[name]
+    count = round((slider["max"] - slider["min"]) / slider["step"]) + 1
+    return [round(slider["min"] + i * slider["step"], 10) for i in range(count)]
+
+
+# Seeds derived from the slider values, before any re-simulate offset
+def lln_base_seed(true_probability):
+    return int(true_probability * 10000)
+
+
+def risk_base_seed(accident_probability, num_policyholders):
+    return int(accident_probability * 10000 + num_policyholders)
+
+
+def capital_base_seed(capital_amount, num_years):
+    return int(capital_amount * 100 + num_years * 10)
+
 
 # Define CSS for better styling
 custom_css = """
@@ -106,7 +144,7 @@ app_ui = ui.page_fluid(
                      ui.row(
                          ui.column(4,
                                    ui.input_slider("true_probability", "True Accident Probability:",
-                                                   min=0.01, max=0.25, value=0.05, step=0.01)
+                                                   **SLIDERS["true_probability"])
                                    ),
                          ui.column(2,
                                    ui.br(),
@@ -121,10 +159,10 @@ app_ui = ui.page_fluid(
                      # Main content below with clear separation
                      ui.div({"class": "plot-container"},
                             ui.div({"class": "plot-title"}, "Observed Probability vs Sample Size"),
-                            ui.output_plot("lln_plot", width="100%", height="500px")
+                            ui.output_image("lln_plot", width="100%", height="500px")
                             ),
                      ui.div({"class": "interpretation-box"},
-                            ui.tags.pre(ui.output_text("lln_interpretation"))
+                            ui.output_ui("lln_interpretation")
                             )
                      ),
 
@@ -143,11 +181,11 @@ app_ui = ui.page_fluid(
                      ui.row(
                          ui.column(3,
                                    ui.input_slider("accident_probability", "Accident Probability:",
-                                                   min=0.01, max=0.25, value=0.05, step=0.01)
+                                                   **SLIDERS["accident_probability"])
                                    ),
                          ui.column(3,
                                    ui.input_slider("num_policyholders", "Number of Policyholders:",
-                                                   min=10, max=1000, value=100, step=10)
+                                                   **SLIDERS["num_policyholders"])
                                    ),
                          ui.column(2,
                                    ui.br(),
@@ -162,10 +200,10 @@ app_ui = ui.page_fluid(
                      # Main content below with clear separation
                      ui.div({"class": "plot-container"},
                             ui.div({"class": "plot-title"}, "Individual vs Pooled Risk"),
-                            ui.output_plot("risk_pooling_plot", width="100%", height="500px")
+                            ui.output_image("risk_pooling_plot", width="100%", height="500px")
                             ),
                      ui.div({"class": "interpretation-box"},
-                            ui.tags.pre(ui.output_text("risk_pooling_interpretation"))
+                            ui.output_ui("risk_pooling_interpretation")
                             )
                      ),
 
@@ -184,7 +222,7 @@ app_ui = ui.page_fluid(
                      ui.row(
                          ui.column(6,
                                    ui.input_slider("loss_ratio", "Loss Ratio:",
-                                                   min=0.40, max=1.0, value=0.65, step=0.05)
+                                                   **SLIDERS["loss_ratio"])
                                    ),
                          ui.column(6)
                      ),
@@ -192,10 +230,10 @@ app_ui = ui.page_fluid(
                      # Main content below with clear separation
                      ui.div({"class": "plot-container"},
                             ui.div({"class": "plot-title"}, "Insurance Company Balance Sheet"),
-                            ui.output_plot("balance_sheet_plot", width="100%", height="600px")
+                            ui.output_image("balance_sheet_plot", width="100%", height="600px")
                             ),
                      ui.div({"class": "interpretation-box"},
-                            ui.tags.pre(ui.output_text("balance_sheet_interpretation"))
+                            ui.output_ui("balance_sheet_interpretation")
                             )
                      ),
 
@@ -214,11 +252,11 @@ app_ui = ui.page_fluid(
                      ui.row(
                          ui.column(4,
                                    ui.input_slider("accident_frequency", "Accident Frequency:",
-                                                   min=0.01, max=0.20, value=0.05, step=0.01)
+                                                   **SLIDERS["accident_frequency"])
                                    ),
                          ui.column(4,
                                    ui.input_slider("claim_severity", "Claim Severity ($):",
-                                                   min=2000, max=20000, value=8000, step=1000)
+                                                   **SLIDERS["claim_severity"])
                                    ),
                          ui.column(4)
                      ),
@@ -226,10 +264,10 @@ app_ui = ui.page_fluid(
                      # Main content below with clear separation
                      ui.div({"class": "plot-container"},
                             ui.div({"class": "plot-title"}, "Premium Components and Breakdown"),
-                            ui.output_plot("premium_calc_plot", width="100%", height="600px")
+                            ui.output_image("premium_calc_plot", width="100%", height="600px")
                             ),
                      ui.div({"class": "interpretation-box"},
-                            ui.tags.pre(ui.output_text("premium_calc_interpretation"))
+                            ui.output_ui("premium_calc_interpretation")
                             )
                      ),
 
@@ -248,11 +286,11 @@ app_ui = ui.page_fluid(
                      ui.row(
                          ui.column(3,
                                    ui.input_slider("capital_amount", "Initial Capital ($M):",
-                                                   min=10, max=100, value=50, step=10)
+                                                   **SLIDERS["capital_amount"])
                                    ),
                          ui.column(3,
                                    ui.input_slider("num_years", "Simulation Years:",
-                                                   min=5, max=100, value=10, step=5)
+                                                   **SLIDERS["num_years"])
                                    ),
                          ui.column(2,
                                    ui.br(),
@@ -267,16 +305,169 @@ app_ui = ui.page_fluid(
                      # Main content below with clear separation
                      ui.div({"class": "plot-container"},
                             ui.div({"class": "plot-title"}, "Capital Protection Against Bankruptcy"),
-                            ui.output_plot("capital_role_plot", width="100%", height="600px")
+                            ui.output_image("capital_role_plot", width="100%", height="600px")
                             ),
                      ui.div({"class": "interpretation-box"},
-                            ui.tags.pre(ui.output_text("capital_role_interpretation"))
+                            ui.output_ui("capital_role_interpretation")
                             )
                      )
     )
 )
 
 
+# Plots are sent as SVG: no rasterization on the server, and the payload stays
+# small and sharp at any screen density
+PLOT_DPI = 100  # Same scale render.plot used for fonts and line widths
+
+
+def figure_svg(fig, width, height):
+    """
+    Render a figure as SVG at the given size.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure to render
+    width, height : int
+        Size of the output container in pixels
+
+    Returns:
+    --------
+    bytes
+        SVG document
+    """
+    fig.set_size_inches(width / PLOT_DPI, height / PLOT_DPI)
+
+    # Lay out once and save with the engine detached: with an engine set,
+    # savefig draws the whole figure twice (a dry run to lay out, then the real one)
+    engine = fig.get_layout_engine()
+    (engine or TightLayoutEngine()).execute(fig)
+    fig.set_layout_engine(None)
+
+    buffer = io.BytesIO()
+    try:
+        # Keep text as <text> elements rather than glyph paths
+        with matplotlib.rc_context({"svg.fonttype": "none"}):
+            fig.savefig(buffer, format="svg", dpi=PLOT_DPI)
+    finally:
+        if engine is not None:
+            fig.set_layout_engine(engine)
+    return buffer.getvalue()
+
+
+def svg_image(svg, width, height):
+    """
+    Write an SVG document to a temporary file for render.image.
+
+    Parameters:
+    -----------
+    svg : bytes
+        SVG document
+    width, height : int
+        Size of the output container in pixels
+
+    Returns:
+    --------
+    dict
+        Image data for render.image (which deletes the file once sent)
+    """
+    with tempfile.NamedTemporaryFile(suffix=".svg", delete=False) as f:
+        f.write(svg)
+    return {"src": f.name, "width": f"{width}px", "height": f"{height}px"}
+
+
+@lru_cache(maxsize=256)
+def interpretation_html(text):
+    """
+    Escape interpretation text into a preformatted HTML block.
+
+    Cached on the text, so revisiting a slider position re-sends the same
+    markup without escaping it again.
+
+    Parameters:
+    -----------
+    text : str
+        Plain interpretation text, one bullet per line
+
+    Returns:
+    --------
+    htmltools.HTML
+        Markup for render.ui
+    """
+    return ui.HTML(f"<pre>{html.escape(text, quote=False)}</pre>")
+
+
+# Recently drawn plots as SVG, shared by all sessions (the bytes are immutable):
+# (output_id, inputs, width, height) -> SVG, least recently used first
+PLOT_CACHE = OrderedDict()
+PLOT_CACHE_SIZE = 64  # ~50KB each
+
+
+# Settle time for each tab's sliders, so changes to several of them in quick
+# succession are merged into one recompute (the browser already waits 250ms
+# before sending each slider's value)
+DEBOUNCE_SECS = 0.25
+
+
+def debounce(delay_secs):
+    """
+    Decorator that delays a reactive value until it has stopped changing.
+
+    The first value is passed through immediately; after that, dependents are
+    only invalidated once no new value has arrived for delay_secs.
+
+    Parameters:
+    -----------
+    delay_secs : float
+        Quiet period required before a new value is passed on
+
+    Returns:
+    --------
+    callable
+        Decorator turning a reactive function into a debounced reactive.Calc
+    """
+    def wrapper(func):
+        deadline = reactive.Value(None)
+        trigger = reactive.Value(0)
+
+        @reactive.Calc
+        def latest():
+            return func()
+
+        started = [False]
+
+        @reactive.Effect(priority=102)
+        def _restart_timer():
+            try:
+                latest()
+            finally:
+                # The initial value already went straight through
+                if started[0]:
+                    deadline.set(time.time() + delay_secs)
+                started[0] = True
+
+        @reactive.Effect(priority=101)
+        def _wait():
+            due = deadline()
+            if due is None:
+                return
+            remaining = due - time.time()
+            if remaining > 0:
+                reactive.invalidate_later(remaining)
+                return
+            with reactive.isolate():
+                deadline.set(None)
+                trigger.set(trigger() + 1)
+
+        @reactive.Calc
+        @reactive.event(trigger)
+        def debounced():
+            return latest()
+
+        return debounced
+    return wrapper
+
+
 # Server logic
 def server(input, output, session):
     # Reactive values to track simulation offsets - only for the modules that should be random
@@ -284,44 +475,82 @@ def server(input, output, session):
     risk_sim_offset = reactive.Value(0)
     capital_sim_offset = reactive.Value(0)
 
+    # Per-session generator for the re-simulate offsets, seeded from the OS,
+    # rather than the process-wide state of the random module
+    offset_rng = random.Random()
+
+    # One Figure per plot, created on first render and redrawn in place afterwards.
+    # Kept per session so concurrent users never draw into each other's figures.
+    figures = {}
+
+    def release_figures():
+        for fig in figures.values():
+            release_artists(fig)
+        figures.clear()
+
+    session.on_ended(release_figures)
+
+    # Debounced slider values, one timer per tab, so a burst of changes to a
+    # tab's sliders simulates and draws once for where they all stop
+    true_probability = debounce(DEBOUNCE_SECS)(input.true_probability)
+    loss_ratio = debounce(DEBOUNCE_SECS)(input.loss_ratio)
+
+    @debounce(DEBOUNCE_SECS)
+    def risk_inputs():
+        return input.accident_probability(), input.num_policyholders()
+
+    @debounce(DEBOUNCE_SECS)
+    def premium_inputs():
+        return input.accident_frequency(), input.claim_severity()
+
+    @debounce(DEBOUNCE_SECS)
+    def capital_inputs():
+        return input.capital_amount(), input.num_years()
+
+    def plot_image(output_id, key, get_fig, default_width=900, default_height=500):
+        """Send a plot's SVG, drawing it only if these inputs and size are not in PLOT_CACHE."""
+        width = session.clientdata.output_width(output_id) or default_width
+        height = session.clientdata.output_height(output_id) or default_height
+        cache_key = (output_id, key, width, height)
+        svg = PLOT_CACHE.get(cache_key)
+        if svg is None:
+            svg = PLOT_CACHE[cache_key] = figure_svg(get_fig(), width, height)
+            if len(PLOT_CACHE) > PLOT_CACHE_SIZE:
+                PLOT_CACHE.popitem(last=False)
+        else:
+            PLOT_CACHE.move_to_end(cache_key)
+        return svg_image(svg, width, height)
+
+    def bind_offset(button, offset, name):
+        """Draw a new seed offset each time a re-simulate button is clicked."""
+        @reactive.Effect
+        @reactive.event(button)
+        def _update_seed():
+            new_offset = offset_rng.randint(1, 10000)
+            offset.set(new_offset)
+            print(f"{name} seed offset updated to: {new_offset}")
+
     # Update offset values when re-simulate buttons are clicked
-    @reactive.Effect
-    @reactive.event(input.resim_lln)
-    def _update_lln_seed():
-        new_offset = random.randint(1, 10000)
-        lln_sim_offset.set(new_offset)
-        print(f"LLN seed offset updated to: {new_offset}")
-
-    @reactive.Effect
-    @reactive.event(input.resim_risk)
-    def _update_risk_seed():
-        new_offset = random.randint(1, 10000)
-        risk_sim_offset.set(new_offset)
-        print(f"Risk pooling seed offset updated to: {new_offset}")
-
-    @reactive.Effect
-    @reactive.event(input.resim_capital)
-    def _update_capital_seed():
-        new_offset = random.randint(1, 10000)
-        capital_sim_offset.set(new_offset)
-        print(f"Capital role seed offset updated to: {new_offset}")
+    bind_offset(input.resim_lln, lln_sim_offset, "LLN")
+    bind_offset(input.resim_risk, risk_sim_offset, "Risk pooling")
+    bind_offset(input.resim_capital, capital_sim_offset, "Capital role")
 
     # Reactive calculations for seed values
     @reactive.Calc
     def lln_seed():
-        base_seed = int(input.true_probability() * 10000)
+        base_seed = lln_base_seed(true_probability())
         offset = lln_sim_offset.get()
         return base_seed + offset, base_seed, offset
 
     @reactive.Calc
     def risk_seed():
-        base_seed = int(input.accident_probability() * 10000 + input.num_policyholders())
+        base_seed = risk_base_seed(*risk_inputs())
         offset = risk_sim_offset.get()
         return base_seed + offset, base_seed, offset
 
     @reactive.Calc
     def capital_seed():
-        base_seed = int(input.capital_amount() * 100 + input.num_years() * 10)
+        base_seed = capital_base_seed(*capital_inputs())
         offset = capital_sim_offset.get()
         return base_seed + offset, base_seed, offset
 
@@ -345,187 +574,237 @@ def server(input, output, session):
         return f"Seed: {seed} (Base: {base}, Offset: {offset})"
 
     # Law of Large Numbers - RANDOM MODULE
+    # Stats feed the text directly; the figure is drawn from the same stats
     @reactive.Calc
-    def lln_data():
+    def lln_stats():
         seed, base, offset = lln_seed()
         print(f"LLN using seed: {seed} (base: {base}, offset: {offset})")
-        return demonstrate_law_of_large_numbers(input.true_probability(), seed=seed, return_fig=True)
+        return compute_law_of_large_numbers(true_probability(), seed)
+
+    @reactive.Calc
+    def lln_fig():
+        figures["lln"] = plot_law_of_large_numbers(lln_stats(), fig=figures.get("lln"))
+        return figures["lln"]
 
     @output
-    @render.plot
+    @render.image(delete_file=True)
     def lln_plot():
-        fig, _ = lln_data()
-        return fig
+        seed, _, _ = lln_seed()
+        # Rounding keeps float noise out of the key
+        return plot_image("lln_plot", (round(true_probability(), 2), seed), lln_fig)
 
     @output
-    @render.text
+    @render.ui
     def lln_interpretation():
-        _, stats = lln_data()
-        seed, base, offset = lln_seed()
-
-        text = "Insurance Interpretation:\n"
-        text += f"• With only 10 drivers, the observed accident rate was {stats['small_sample']:.1%}, "
-        text += f"which is {abs(stats['small_sample'] - input.true_probability()) * 100:.1f} percentage points away from the true rate of {input.true_probability():.1%}\n"
-        text += f"• With 50,000 drivers, the observed accident rate was {stats['large_sample']:.1%}, "
-        text += f"which is {abs(stats['large_sample'] - input.true_probability()) * 100:.1f} percentage points away from the true rate\n"
-        text += "• Insurance companies rely on large numbers of policyholders to make accurate predictions!"
-
-        return text
+        stats = lln_stats()
+        true_rate = true_probability()
+
+        return interpretation_html("\n".join([
+            "Insurance Interpretation:",
+            f"• With only 10 drivers, the observed accident rate was {stats['small_sample']:.1%}, "
+            f"which is {abs(stats['small_sample'] - true_rate) * 100:.1f} percentage points away from the true rate of {true_rate:.1%}",
+            f"• With 50,000 drivers, the observed accident rate was {stats['large_sample']:.1%}, "
+            f"which is {abs(stats['large_sample'] - true_rate) * 100:.1f} percentage points away from the true rate",
+            "• Insurance companies rely on large numbers of policyholders to make accurate predictions!",
+        ]))
 
     # Risk Pooling - RANDOM MODULE
     @reactive.Calc
-    def risk_data():
+    def risk_stats():
         seed, base, offset = risk_seed()
         print(f"Risk Pooling using seed: {seed} (base: {base}, offset: {offset})")
-        return demonstrate_risk_pooling(
-            input.accident_probability(),
-            input.num_policyholders(),
-            seed=seed,
-            return_fig=True
-        )
+        accident_probability, num_policyholders = risk_inputs()
+        return compute_risk_pooling(accident_probability, num_policyholders, seed)
+
+    @reactive.Calc
+    def risk_fig():
+        figures["risk"] = plot_risk_pooling(risk_stats(), fig=figures.get("risk"))
+        return figures["risk"]
 
     @output
-    @render.plot
+    @render.image(delete_file=True)
     def risk_pooling_plot():
-        fig, _ = risk_data()
-        return fig
+        seed, _, _ = risk_seed()
+        accident_probability, num_policyholders = risk_inputs()
+        key = (round(accident_probability, 2), num_policyholders, seed)
+        return plot_image("risk_pooling_plot", key, risk_fig)
 
     @output
-    @render.text
+    @render.ui
     def risk_pooling_interpretation():
-        _, stats = risk_data()
-        claim_amount = 20000  # Fixed claim amount
-
-        text = "Insurance Interpretation:\n"
-        text += f"• Individual Risk: Each person has a {input.accident_probability():.1%} chance of a ${claim_amount:,.0f} loss.\n"
-        text += f"• Without Insurance: {stats['num_with_loss']} people ({stats['percent_with_loss']:.1f}%) faced a ${claim_amount:,.0f} loss in this simulation.\n"
-        text += f"• With Insurance: Everyone pays a premium of ${stats['fair_premium']:.0f}.\n"
-        text += f"• Risk Pooling Result: The insurer collected ${stats['pool_premium_total']:,.0f} and paid ${stats['total_losses']:,.0f} in claims.\n"
+        stats = risk_stats()
+        accident_probability, _ = risk_inputs()
+        claim = f"${CLAIM_AMOUNT:,.0f}"
+        pool_result = f"${abs(stats['pool_premium_total'] - stats['total_losses']):,.0f}"
+
+        lines = [
+            "Insurance Interpretation:",
+            f"• Individual Risk: Each person has a {accident_probability:.1%} chance of a {claim} loss.",
+            f"• Without Insurance: {stats['num_with_loss']} people ({stats['percent_with_loss']:.1f}%) faced a {claim} loss in this simulation.",
+            f"• With Insurance: Everyone pays a premium of ${stats['fair_premium']:.0f}.",
+            f"• Risk Pooling Result: The insurer collected ${stats['pool_premium_total']:,.0f} and paid ${stats['total_losses']:,.0f} in claims.",
+        ]
 
         if stats['pool_performance'] < 1:
-            text += f"• This year the insurance pool had a ${abs(stats['pool_premium_total'] - stats['total_losses']):,.0f} surplus.\n"
-            text += "• The surplus can be held as capital to handle future years when claims exceed premiums.\n"
+            lines.append(f"• This year the insurance pool had a {pool_result} surplus.")
+            lines.append("• The surplus can be held as capital to handle future years when claims exceed premiums.")
         else:
-            text += f"• This year the insurance pool had a ${abs(stats['pool_premium_total'] - stats['total_losses']):,.0f} deficit.\n"
-            text += "• The deficit must be covered by the insurer's capital reserves.\n"
+            lines.append(f"• This year the insurance pool had a {pool_result} deficit.")
+            lines.append("• The deficit must be covered by the insurer's capital reserves.")
 
-        text += f"• Key Insight: As the number of policyholders increases, the 'Actual/Expected' ratio approaches 1.0, "
-        text += f"making the insurance pool's results more predictable and stable."
+        lines.append("• Key Insight: As the number of policyholders increases, the 'Actual/Expected' ratio approaches 1.0, "
+                     "making the insurance pool's results more predictable and stable.")
 
-        return text
+        return interpretation_html("\n".join(lines))
 
     # Balance Sheet - DETERMINISTIC MODULE (no randomness)
     @reactive.Calc
-    def balance_sheet_data():
-        # Simply pass the loss ratio directly - no randomness
-        return demonstrate_balance_sheet(input.loss_ratio(), return_fig=True)
+    def balance_sheet_stats():
+        return compute_balance_sheet(loss_ratio())
+
+    @reactive.Calc
+    def balance_sheet_fig():
+        figures["balance_sheet"] = plot_balance_sheet(balance_sheet_stats(), fig=figures.get("balance_sheet"))
+        return figures["balance_sheet"]
 
     @output
-    @render.plot
+    @render.image(delete_file=True)
     def balance_sheet_plot():
-        fig, _ = balance_sheet_data()
-        return fig
+        return plot_image("balance_sheet_plot", round(loss_ratio(), 2), balance_sheet_fig, default_height=600)
 
     @output
-    @render.text
+    @render.ui
     def balance_sheet_interpretation():
-        _, stats = balance_sheet_data()
-
-        premium_revenue = 100  # $100M in premium (fixed)
-        min_capital_ratio = 0.5
-
-        text = "Insurance Interpretation:\n"
-        text += f"• Loss Ratio: {stats['expected_losses'] / premium_revenue:.2f} (${stats['expected_losses']:.1f}M in losses per ${premium_revenue:.1f}M in premium)\n"
-        text += f"• Underwriting Result: ${stats['underwriting_result']:.1f}M\n"
-        text += f"• Investment Income: ${stats['investment_income']:.1f}M\n"
-        text += f"• Total Profit: ${stats['total_profit']:.1f}M\n"
-        text += f"• Capital: ${stats['capital']:.1f}M (Capital Ratio: {stats['capital_ratio']:.2f})\n"
-
-        if stats['capital_ratio'] < min_capital_ratio:
-            text += f"• ALERT: Capital ratio is below the regulatory minimum of {min_capital_ratio:.2f}!\n"
-            text += f"• The company needs at least ${(min_capital_ratio * premium_revenue - stats['capital']):.1f}M more capital to meet minimum requirements."
+        stats = balance_sheet_stats()
+        min_capital = MIN_CAPITAL_RATIO * PREMIUM_REVENUE
+
+        lines = [
+            "Insurance Interpretation:",
+            f"• Loss Ratio: {stats['expected_losses'] / PREMIUM_REVENUE:.2f} (${stats['expected_losses']:.1f}M in losses per ${PREMIUM_REVENUE:.1f}M in premium)",
+            f"• Underwriting Result: ${stats['underwriting_result']:.1f}M",
+            f"• Investment Income: ${stats['investment_income']:.1f}M",
+            f"• Total Profit: ${stats['total_profit']:.1f}M",
+            f"• Capital: ${stats['capital']:.1f}M (Capital Ratio: {stats['capital_ratio']:.2f})",
+        ]
+
+        if stats['capital_ratio'] < MIN_CAPITAL_RATIO:
+            lines.append(f"• ALERT: Capital ratio is below the regulatory minimum of {MIN_CAPITAL_RATIO:.2f}!")
+            lines.append(f"• The company needs at least ${(min_capital - stats['capital']):.1f}M more capital to meet minimum requirements.")
         else:
-            surplus = stats['capital'] - (min_capital_ratio * premium_revenue)
-            text += f"• The company has ${surplus:.1f}M of capital surplus above the regulatory minimum."
+            surplus = stats['capital'] - min_capital
+            lines.append(f"• The company has ${surplus:.1f}M of capital surplus above the regulatory minimum.")
 
-        return text
+        return interpretation_html("\n".join(lines))
 
     # Premium Calculation - DETERMINISTIC MODULE (no randomness)
     @reactive.Calc
-    def premium_calc_data():
-        # Simply pass the parameters directly - no randomness
-        return demonstrate_premium_calculation(
-            input.accident_frequency(),
-            input.claim_severity(),
-            return_fig=True
-        )
+    def premium_calc_stats():
+        return compute_premium_calculation(*premium_inputs())
+
+    @reactive.Calc
+    def premium_calc_fig():
+        figures["premium_calc"] = plot_premium_calculation(premium_calc_stats(), fig=figures.get("premium_calc"))
+        return figures["premium_calc"]
 
     @output
-    @render.plot
+    @render.image(delete_file=True)
     def premium_calc_plot():
-        fig, _ = premium_calc_data()
-        return fig
+        accident_frequency, claim_severity = premium_inputs()
+        key = (round(accident_frequency, 2), claim_severity)
+        return plot_image("premium_calc_plot", key, premium_calc_fig, default_height=600)
 
     @output
-    @render.text
+    @render.ui
     def premium_calc_interpretation():
-        _, stats = premium_calc_data()
-
-        expense_ratio = 0.25
-        risk_margin_ratio = 0.05
-
-        text = "Insurance Interpretation:\n"
-        text += f"• Accident Frequency: {input.accident_frequency():.1%} (probability of claim per year)\n"
-        text += f"• Average Claim Severity: ${input.claim_severity():,.0f} (average cost when a claim occurs)\n"
-        text += f"• Expected Loss: ${stats['expected_loss']:.2f} (pure cost of risk)\n"
-        text += f"• Expenses: ${stats['expenses']:.2f} ({expense_ratio:.0%} of premium for administration, commissions, etc.)\n"
-        text += f"• Risk Margin: ${stats['risk_margin']:.2f} ({risk_margin_ratio:.0%} of premium for profit and uncertainty)\n"
-        text += f"• Final Premium: ${stats['premium']:.2f}\n"
-        text += "• This is the base premium before applying individual rating factors like age, driving history, etc."
-
-        return text
+        stats = premium_calc_stats()
+        accident_frequency, claim_severity = premium_inputs()
+
+        return interpretation_html("\n".join([
+            "Insurance Interpretation:",
+            f"• Accident Frequency: {accident_frequency:.1%} (probability of claim per year)",
+            f"• Average Claim Severity: ${claim_severity:,.0f} (average cost when a claim occurs)",
+            f"• Expected Loss: ${stats['expected_loss']:.2f} (pure cost of risk)",
+            f"• Expenses: ${stats['expenses']:.2f} ({EXPENSE_RATIO:.0%} of premium for administration, commissions, etc.)",
+            f"• Risk Margin: ${stats['risk_margin']:.2f} ({RISK_MARGIN_RATIO:.0%} of premium for profit and uncertainty)",
+            f"• Final Premium: ${stats['premium']:.2f}",
+            "• This is the base premium before applying individual rating factors like age, driving history, etc.",
+        ]))
 
     # Capital Role - RANDOM MODULE
     @reactive.Calc
-    def capital_role_data():
+    def capital_role_stats():
         seed, base, offset = capital_seed()
         print(f"Capital Role using seed: {seed} (base: {base}, offset: {offset})")
-        return demonstrate_capital_role(
-            input.capital_amount(),
-            input.num_years(),
-            seed=seed,
-            return_fig=True
-        )
+        capital_amount, num_years = capital_inputs()
+        return compute_capital_role(capital_amount, num_years, seed)
+
+    @reactive.Calc
+    def capital_role_fig():
+        figures["capital_role"] = plot_capital_role(capital_role_stats(), fig=figures.get("capital_role"))
+        return figures["capital_role"]
 
     @output
-    @render.plot
+    @render.image(delete_file=True)
     def capital_role_plot():
-        fig, _ = capital_role_data()
-        return fig
+        seed, _, _ = capital_seed()
+        key = (*capital_inputs(), seed)
+        return plot_image("capital_role_plot", key, capital_role_fig, default_height=600)
 
     @output
-    @render.text
+    @render.ui
     def capital_role_interpretation():
-        _, stats = capital_role_data()
-
-        annual_premium = 100.0  # $100M annual premium - consistent with balance sheet
-        capital_ratio = input.capital_amount() / annual_premium
-
-        text = "Insurance Interpretation:\n"
-        text += f"• Capital serves as a buffer against unexpected losses.\n"
-        text += f"• With ${input.capital_amount():.1f}M of initial capital ({capital_ratio:.1f}x annual premium), "
-        text += f"{stats['survival_rate']:.1%} of companies survived all {input.num_years()} years.\n"
-        text += f"• Higher capital amounts mean better protection against insolvency.\n"
-        text += f"• Insurance regulators require minimum capital levels to ensure companies can pay claims.\n"
+        stats = capital_role_stats()
+        capital, num_years = capital_inputs()
+        capital_ratio = capital / ANNUAL_PREMIUM
+
+        lines = [
+            "Insurance Interpretation:",
+            "• Capital serves as a buffer against unexpected losses.",
+            f"• With ${capital:.1f}M of initial capital ({capital_ratio:.1f}x annual premium), "
+            f"{stats['survival_rate']:.1%} of companies survived all {num_years} years.",
+            "• Higher capital amounts mean better protection against insolvency.",
+            "• Insurance regulators require minimum capital levels to ensure companies can pay claims.",
+        ]
 
         if stats['survival_rate'] < 0.90:
-            text += f"• Warning: This capital level may be inadequate for long-term stability.\n"
-            text += f"• Recommendation: Increase capital to improve survival probability."
+            lines.append("• Warning: This capital level may be inadequate for long-term stability.")
+            lines.append("• Recommendation: Increase capital to improve survival probability.")
         else:
-            text += f"• This capital level appears adequate with a high survival probability."
+            lines.append("• This capital level appears adequate with a high survival probability.")
+
+        return interpretation_html("\n".join(lines))
+
+
+def prewarm_caches():
+    """
+    Run the demonstrations' calculations ahead of the first request.
+
+    The LLN, capital, balance sheet and premium sliders only have a few
+    hundred possible settings between them, so their whole input grids are
+    calculated; risk pooling, whose seed depends on two sliders, gets its
+    starting values. Results land in the modules' lru_caches, which are
+    shared by all sessions, so a render for any of these settings (before
+    a re-simulate click) only has to draw the figure.
+    """
+    defaults = {name: slider["value"] for name, slider in SLIDERS.items()}
+
+    for p in slider_values("true_probability"):
+        compute_law_of_large_numbers(p, lln_base_seed(p))
+    for capital in slider_values("capital_amount"):
+        for years in slider_values("num_years"):
+            compute_capital_role(capital, years, capital_base_seed(capital, years))
+    for loss_ratio in slider_values("loss_ratio"):
+        compute_balance_sheet(loss_ratio)
+    for frequency in slider_values("accident_frequency"):
+        for severity in slider_values("claim_severity"):
+            compute_premium_calculation(frequency, severity)
+
+    compute_risk_pooling(defaults["accident_probability"], defaults["num_policyholders"],
+                         risk_base_seed(defaults["accident_probability"], defaults["num_policyholders"]))
 
-        return text
 
+# Takes ~0.1s, once per process rather than per session
+prewarm_caches()
 
 # Create and run the app
 app = App(app_ui, server)
\ No newline at end of file
@@ -1,343 +1,370 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-from matplotlib.figure import Figure
+from functools import lru_cache
+from .plotting import FixedMarginLayoutEngine, prepare_figure, store_artists, stored_artists
 
+# Base values for a small insurance company (in millions)
+PREMIUM_REVENUE = 100  # $100M in premium
+EXPENSE_RATIO = 0.25  # Fixed expense ratio of 25%
+MIN_CAPITAL_RATIO = 0.5  # Regulatory minimum capital (50% of premium)
+INVESTMENT_RETURN_RATE = 0.05
 
-def demonstrate_balance_sheet(loss_ratio=0.65, return_fig=False):
+# Parts of the statements that do not depend on the loss ratio
+EXPENSES = PREMIUM_REVENUE * EXPENSE_RATIO
+REQUIRED_CAPITAL = PREMIUM_REVENUE * MIN_CAPITAL_RATIO
+INVESTABLE_ASSETS = PREMIUM_REVENUE + REQUIRED_CAPITAL  # Premium + capital are invested
+INVESTMENT_INCOME = INVESTABLE_ASSETS * INVESTMENT_RETURN_RATE
+PREMIUMS_RECEIVABLE = PREMIUM_REVENUE * 0.1  # 10% of premium not yet collected
+UNEARNED_PREMIUM = PREMIUM_REVENUE * 0.5  # Assume 50% of premiums unearned
+
+# Bars of the income statement waterfall, in drawing order
+INCOME_COMPONENTS = ('Premium', 'Losses', 'Expenses', 'Investment Income', 'Profit/Loss')
+
+# Bar colors, chosen once rather than rebuilt on every render
+ASSET_COLORS = ('cornflowerblue', 'skyblue')
+LIAB_CAPITAL_COLORS = ('lightgreen', 'mediumseagreen', 'gold')
+INCOME_COLORS_PROFIT = ('blue', 'red', 'red', 'green', 'purple')
+INCOME_COLORS_LOSS = ('blue', 'red', 'red', 'green', 'red')
+
+# x positions of the Assets and Liabilities & Capital columns
+BALANCE_X_POS = (0.3, 1.7)
+
+# Text box styles, built once and copied by each text artist
+TOTAL_BBOX = dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.3')
+STATUS_BBOX = dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.5')
+
+# Subplot margins in inches, in place of a tight layout solve on every render
+FIGURE_LAYOUT = FixedMarginLayoutEngine(left=1.6, right=0.6, top=0.4, bottom=0.6, gap=0.6)
+
+
+@lru_cache(maxsize=256)
+def compute_balance_sheet(loss_ratio=0.65):
     """
-    Demonstrates the components of an insurance company balance sheet
+    Calculates the balance sheet and income statement for a given loss ratio
+
+    Results are cached on loss_ratio, so repeated calls with the same slider
+    value skip the calculation. The returned dict is shared between callers
+    and must not be modified.
 
     Parameters:
     -----------
     loss_ratio : float
         The loss ratio (losses/premium)
-    return_fig : bool
-        If True, returns the figure and stats for Shiny integration
 
     Returns:
     --------
-    fig : matplotlib.figure.Figure
-        The figure object (if return_fig is True)
     stats : dict
-        Key statistics (if return_fig is True)
+        Key statistics, plus the balance sheet components used for plotting
     """
-    # Base values for a small insurance company (in millions)
-    premium_revenue = 100  # $100M in premium
-
     # Calculate components based on loss ratio
     # Loss ratio = losses/premium
-    expected_losses = premium_revenue * loss_ratio
-    expenses = premium_revenue * 0.25  # Fixed expense ratio of 25%
-    required_capital = premium_revenue * 0.5  # Regulatory minimum capital
-
-    # Define the minimum capital ratio
-    min_capital_ratio = 0.5  # Matches the required_capital calculation above
+    expected_losses = PREMIUM_REVENUE * loss_ratio
 
     # Calculate underwriting profit/loss
-    underwriting_result = premium_revenue - expected_losses - expenses
-
-    # Calculate investment income (5% return on invested premium+capital)
-    investable_assets = premium_revenue + required_capital
-    investment_return_rate = 0.05
-    investment_income = investable_assets * investment_return_rate
+    underwriting_result = PREMIUM_REVENUE - expected_losses - EXPENSES
 
     # Total profit/loss
-    total_profit = underwriting_result + investment_income
+    total_profit = underwriting_result + INVESTMENT_INCOME
 
     # Balance sheet components
     assets = {
-        'Premiums Receivable': premium_revenue * 0.1,  # 10% of premium not yet collected
-        'Cash & Investments': investable_assets
+        'Premiums Receivable': PREMIUMS_RECEIVABLE,
+        'Cash & Investments': INVESTABLE_ASSETS
     }
 
     liabilities = {
         'Loss Reserves': expected_losses,
-        'Unearned Premium': premium_revenue * 0.5  # Assume 50% of premiums unearned
+        'Unearned Premium': UNEARNED_PREMIUM
     }
 
     # Total assets and liabilities
-    total_assets = sum(assets.values())
-    total_liabilities = sum(liabilities.values())
+    total_assets = PREMIUMS_RECEIVABLE + INVESTABLE_ASSETS
+    total_liabilities = expected_losses + UNEARNED_PREMIUM
 
     # Capital (equity) = assets - liabilities
     capital = total_assets - total_liabilities
 
     # Capital ratio = capital / premium
-    capital_ratio = capital / premium_revenue
+    capital_ratio = capital / PREMIUM_REVENUE
+
+    return {
+        'expected_losses': expected_losses,
+        'expenses': EXPENSES,
+        'underwriting_result': underwriting_result,
+        'investment_income': INVESTMENT_INCOME,
+        'total_profit': total_profit,
+        'total_assets': total_assets,
+        'total_liabilities': total_liabilities,
+        'capital': capital,
+        'capital_ratio': capital_ratio,
+        'loss_ratio': loss_ratio,
+        'premium_revenue': PREMIUM_REVENUE,
+        'min_capital_ratio': MIN_CAPITAL_RATIO,
+        'assets': assets,
+        'liabilities': liabilities
+    }
+
+
+def _liab_capital_column(stats):
+    """Returns names, values and bottoms of the stacked Liabilities & Capital bar"""
+    liabilities = stats['liabilities']
+    liab_capital_names = tuple(liabilities) + ('Capital (Equity)',)
+    liab_capital_values = np.array(tuple(liabilities.values()) + (stats['capital'],))
+    liab_capital_bottoms = np.concatenate(([0], np.cumsum(liab_capital_values)[:-1]))
+    return liab_capital_names, liab_capital_values, liab_capital_bottoms
+
+
+def _income_waterfall(stats):
+    """Returns values, bottoms, heights and colors of the INCOME_COMPONENTS waterfall bars"""
+    total_profit = stats['total_profit']
+    values = np.array([stats['premium_revenue'], -stats['expected_losses'], -stats['expenses'],
+                       stats['investment_income'], total_profit])
+
+    # Calculate positions for waterfall chart: each component runs from the total
+    # before it to the total after it, and Profit/Loss is the final total from zero
+    steps = values[:-1]
+    cumulative = np.cumsum(steps)
+    previous = np.concatenate(([0], cumulative[:-1]))
+    bottoms = np.append(np.where(steps > 0, previous, cumulative), 0)
+    heights = np.append(np.abs(steps), total_profit)
+
+    # Colors based on positive/negative values
+    colors = INCOME_COLORS_PROFIT if total_profit >= 0 else INCOME_COLORS_LOSS
+
+    return values, bottoms, heights, colors
+
+
+def _capital_status(capital):
+    """Returns the capital status label and its color"""
+    if capital >= REQUIRED_CAPITAL:
+        return "ADEQUATE", "green"
+    return "INADEQUATE", "red"
+
+
+def _update_balance_sheet(artists, stats):
+    """Moves the artists of an existing balance sheet figure to new statistics"""
+    capital = stats['capital']
+    total_liabilities = stats['total_liabilities']
+
+    # Plot 1: only the liabilities & capital column depends on the loss ratio
+    for bar, text, name, value, bottom in zip(artists['liab_capital_bars'], artists['liab_capital_labels'],
+                                              *_liab_capital_column(stats)):
+        bar.set_y(bottom)
+        bar.set_height(value)
+        text.set_y(bottom + value / 2)
+        text.set_text(f'{name}\n${value:.1f}M')
+    artists['liab_capital_total'].set_y((total_liabilities + capital) * 0.95)
+    artists['liab_capital_total'].set_text(f'Total: ${total_liabilities + capital:.1f}M')
+
+    # Plot 2: waterfall bars and their values
+    values, bottoms, heights, colors = _income_waterfall(stats)
+    for bar, text, value, bottom, height, color in zip(artists['income_bars'], artists['income_labels'],
+                                                       values, bottoms, heights, colors):
+        bar.set_y(bottom)
+        bar.set_height(height)
+        bar.set_facecolor(color)
+        # bar() pins the y autoscale to each bar's bottom; keep that in step
+        bar.sticky_edges.y[:] = [bottom]
+        text.set_y(bottom + height / 2)
+        text.set_text(f'${value:.1f}M')
+        text.set_color('white' if abs(value) > 10 else 'black')
+    artists['ax2'].relim()
+    artists['ax2'].autoscale_view()
+
+    # Plot 3: current capital against the fixed minimum
+    status, color = _capital_status(capital)
+    artists['capital_bar'].set_width(capital)
+    artists['capital_bar'].set_facecolor(color)
+    artists['ax3'].set_xlim(0, max(REQUIRED_CAPITAL, capital) * 1.2)
+    artists['capital_label'].set_x(capital)
+    artists['capital_label'].set_text(f'${capital:.1f}M')
+    artists['status_text'].set_text(f"Capital Status: {status}")
+    artists['status_text'].set_color(color)
+
+
+def plot_balance_sheet(stats, fig=None):
+    """
+    Builds the balance sheet figure from precomputed statistics
+
+    When fig was previously drawn by this function, its bars, labels and
+    capital status are updated in place instead of rebuilding the figure.
+
+    Parameters:
+    -----------
+    stats : dict
+        Statistics returned by compute_balance_sheet
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to update or redraw into instead of creating a new one
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object
+    """
+    artists = stored_artists(fig, 'plot_balance_sheet')
+    if artists is not None:
+        _update_balance_sheet(artists, stats)
+        return fig
+
+    total_assets = stats['total_assets']
+    total_liabilities = stats['total_liabilities']
+    capital = stats['capital']
+    assets = stats['assets']
+
+    # Create figure with three vertically stacked subplots
+    fig = prepare_figure(fig, figsize=(12, 15))
+
+    ax1 = fig.add_subplot(311)
+    ax2 = fig.add_subplot(312)
+    ax3 = fig.add_subplot(313)
+
+    # Plot 1: Balance Sheet
+    x_pos = BALANCE_X_POS
+
+    # Create the stacked bar for Assets side, one bar() call for all segments
+    asset_names = tuple(assets)
+    asset_values = np.array(tuple(assets.values()))
+    asset_bottoms = np.concatenate(([0], np.cumsum(asset_values)[:-1]))
+    ax1.bar(x_pos[0], asset_values, bottom=asset_bottoms, width=0.8, color=ASSET_COLORS, alpha=0.7)
+    for name, value, bottom in zip(asset_names, asset_values, asset_bottoms):
+        ax1.text(x_pos[0], bottom + value / 2, f'{name}\n${value:.1f}M',
+                 ha='center', va='center', fontsize=11)
+
+    # Create the stacked bar for Liabilities & Capital side
+    liab_capital_names, liab_capital_values, liab_capital_bottoms = _liab_capital_column(stats)
+    liab_capital_bars = ax1.bar(x_pos[1], liab_capital_values, bottom=liab_capital_bottoms, width=0.8,
+                                color=LIAB_CAPITAL_COLORS, alpha=0.7)
+    liab_capital_labels = []
+    for name, value, bottom in zip(liab_capital_names, liab_capital_values, liab_capital_bottoms):
+        liab_capital_labels.append(ax1.text(x_pos[1], bottom + value / 2, f'{name}\n${value:.1f}M',
+                                            ha='center', va='center', fontsize=11))
+
+    # Set x-axis labels properly
+    ax1.set_xticks(x_pos)
+    ax1.set_xticklabels(['Assets', 'Liabilities & Capital'])
+
+    ax1.set_title('Balance Sheet (in $ millions)')
+    ax1.set_ylabel('Amount ($ millions)')
+
+    # Add totals adjacent to the bars
+    ax1.text(0.35, total_assets * 0.95, f'Total: ${total_assets:.1f}M', ha='left', fontsize=12,
+             bbox=TOTAL_BBOX)
+    liab_capital_total = ax1.text(1.35, (total_liabilities + capital) * 0.95,
+                                  f'Total: ${total_liabilities + capital:.1f}M', ha='left', fontsize=12,
+                                  bbox=TOTAL_BBOX)
+
+    # Set limits to make room for the labels
+    ax1.set_ylim(0, total_assets * 1.1)
+    ax1.set_xlim(-0.5, 2.5)
+
+    # Plot 2: Income components as a waterfall chart
+    values, bottoms, heights, colors = _income_waterfall(stats)
+    income_bars = ax2.bar(INCOME_COMPONENTS, heights, bottom=bottoms, color=colors, alpha=0.7)
+
+    # Add values, centred on each bar
+    income_labels = []
+    for i, (value, bottom, height) in enumerate(zip(values, bottoms, heights)):
+        income_labels.append(ax2.text(i, bottom + height / 2, f'${value:.1f}M', ha='center', va='center',
+                                      color='white' if abs(value) > 10 else 'black'))
+
+    ax2.set_title('Income Statement (in $ millions)')
+    ax2.set_ylabel('Amount ($ millions)')
+    ax2.grid(axis='y', alpha=0.3)
+
+    # Plot 3: Capital in absolute dollars instead of as a ratio
+    min_capital = REQUIRED_CAPITAL
+    status, color = _capital_status(capital)
+
+    # Create horizontal bar for capital
+    capital_bar, = ax3.barh(['Current Capital'], [capital], color=color, alpha=0.7)
+    ax3.barh(['Minimum Required'], [min_capital], color='red', alpha=0.3)
+
+    ax3.set_title('Capital Requirements (in $ millions)')
+    ax3.set_xlabel('Amount ($ millions)')
+    ax3.set_xlim(0, max(min_capital, capital) * 1.2)
+
+    # Add annotations
+    capital_label = ax3.text(capital, 0, f'${capital:.1f}M', va='center')
+    ax3.text(min_capital, 1, f'${min_capital:.1f}M (Minimum)', va='center')
+
+    # Add interpretation text
+    status_text = ax3.text(0.5, 0.5, f"Capital Status: {status}", transform=ax3.transAxes,
+                           ha='center', va='center', fontsize=16, color=color,
+                           bbox=STATUS_BBOX)
+
+    # Margins measured from tight layout across the loss ratio range
+    fig.set_layout_engine(FIGURE_LAYOUT)
+
+    store_artists(fig, 'plot_balance_sheet', {
+        'ax1': ax1,
+        'ax2': ax2,
+        'ax3': ax3,
+        'liab_capital_bars': liab_capital_bars,
+        'liab_capital_labels': liab_capital_labels,
+        'liab_capital_total': liab_capital_total,
+        'income_bars': income_bars,
+        'income_labels': income_labels,
+        'capital_bar': capital_bar,
+        'capital_label': capital_label,
+        'status_text': status_text,
+    })
+
+    return fig
+
+
+def demonstrate_balance_sheet(loss_ratio=0.65, return_fig=False, fig=None):
+    """
+    Demonstrates the components of an insurance company balance sheet
+
+    Parameters:
+    -----------
+    loss_ratio : float
+        The loss ratio (losses/premium)
+    return_fig : bool
+        If True, returns the figure and stats for Shiny integration
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to redraw into when return_fig is True
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object (if return_fig is True)
+    stats : dict
+        Key statistics (if return_fig is True)
+    """
+    stats = compute_balance_sheet(loss_ratio)
 
     # For Shiny integration
     if return_fig:
-        # Create figure with three vertically stacked subplots
-        fig = Figure(figsize=(12, 15))
-
-        ax1 = fig.add_subplot(311)
-        ax2 = fig.add_subplot(312)
-        ax3 = fig.add_subplot(313)
-
-        # Plot 1: Balance Sheet
-        # Create x positions for the two groups of bars
-        x_pos = [0.3, 1.7]
-
-        # Create the stacked bar for Assets side
-        asset_values = list(assets.values())
-        asset_bottom = 0
-        asset_colors = ['cornflowerblue', 'skyblue']
-        for i, value in enumerate(asset_values):
-            ax1.bar(x_pos[0], value, bottom=asset_bottom, width=0.8, color=asset_colors[i], alpha=0.7)
-            ax1.text(x_pos[0], asset_bottom + value / 2, f'{list(assets.keys())[i]}\n${value:.1f}M',
-                     ha='center', va='center', fontsize=11)
-            asset_bottom += value
-
-        # Create the stacked bar for Liabilities & Capital side
-        liab_capital_values = list(liabilities.values()) + [capital]
-        liab_capital_colors = ['lightgreen', 'mediumseagreen', 'gold']
-        liab_bottom = 0
-        for i, value in enumerate(liab_capital_values):
-            color = liab_capital_colors[i]
-            name = list(liabilities.keys())[i] if i < len(liabilities) else 'Capital (Equity)'
-            ax1.bar(x_pos[1], value, bottom=liab_bottom, width=0.8, color=color, alpha=0.7)
-            ax1.text(x_pos[1], liab_bottom + value / 2, f'{name}\n${value:.1f}M',
-                     ha='center', va='center', fontsize=11)
-            liab_bottom += value
-
-        # Set x-axis labels properly
-        ax1.set_xticks(x_pos)
-        ax1.set_xticklabels(['Assets', 'Liabilities & Capital'])
-
-        ax1.set_title('Balance Sheet (in $ millions)')
-        ax1.set_ylabel('Amount ($ millions)')
-
-        # Add totals adjacent to the bars
-        ax1.text(0.35, total_assets * 0.95, f'Total: ${total_assets:.1f}M', ha='left', fontsize=12,
-                 bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.3'))
-        ax1.text(1.35, (total_liabilities + capital) * 0.95, f'Total: ${total_liabilities + capital:.1f}M', ha='left',
-                 fontsize=12,
-                 bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.3'))
-
-        # Set limits to make room for the labels
-        ax1.set_ylim(0, total_assets * 1.1)
-        ax1.set_xlim(-0.5, 2.5)
-
-        # Plot 2: Income components
-        income_components = {
-            'Premium': premium_revenue,
-            'Losses': -expected_losses,
-            'Expenses': -expenses,
-            'Investment Income': investment_income,
-            'Profit/Loss': total_profit
-        }
-
-        # Calculate positions for waterfall chart
-        cumulative = 0
-        bottoms = []
-        heights = []
-
-        for name, value in income_components.items():
-            if name == 'Profit/Loss':
-                bottoms.append(0)
-                heights.append(total_profit)
-            else:
-                bottoms.append(cumulative if value > 0 else cumulative + value)
-                heights.append(abs(value))
-                cumulative += value
-
-        # Colors based on positive/negative values
-        colors = ['blue', 'red', 'red', 'green', 'purple' if total_profit >= 0 else 'red']
-
-        # Create waterfall chart
-        bars = ax2.bar(income_components.keys(), heights, bottom=bottoms, color=colors, alpha=0.7)
-
-        # Add values
-        for i, (name, value) in enumerate(income_components.items()):
-            if name == 'Profit/Loss':
-                ax2.text(i, total_profit / 2 if total_profit >= 0 else total_profit / 2,
-                         f'${value:.1f}M', ha='center', va='center', color='white' if abs(value) > 10 else 'black')
-            else:
-                position = bottoms[i] + heights[i] / 2
-                ax2.text(i, position, f'${value:.1f}M', ha='center', va='center',
-                         color='white' if abs(value) > 10 else 'black')
-
-        ax2.set_title('Income Statement (in $ millions)')
-        ax2.set_ylabel('Amount ($ millions)')
-        ax2.grid(axis='y', alpha=0.3)
-
-        # Plot 3: Capital in absolute dollars instead of as a ratio
-        min_capital = premium_revenue * 0.5  # Regulatory minimum capital (50% of premium)
-
-        # Create horizontal bar for capital
-        ax3.barh(['Current Capital'], [capital], color='green' if capital >= min_capital else 'red',
-                 alpha=0.7)
-        ax3.barh(['Minimum Required'], [min_capital], color='red', alpha=0.3)
-
-        ax3.set_title('Capital Requirements (in $ millions)')
-        ax3.set_xlabel('Amount ($ millions)')
-        ax3.set_xlim(0, max(min_capital, capital) * 1.2)
-
-        # Add annotations
-        ax3.text(capital, 0, f'${capital:.1f}M', va='center')
-        ax3.text(min_capital, 1, f'${min_capital:.1f}M (Minimum)', va='center')
-
-        # Add interpretation text
-        status = "ADEQUATE" if capital >= min_capital else "INADEQUATE"
-        color = "green" if capital >= min_capital else "red"
-
-        ax3.text(0.5, 0.5, f"Capital Status: {status}", transform=ax3.transAxes,
-                 ha='center', va='center', fontsize=16, color=color,
-                 bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.5'))
-
-        # Adjust spacing between subplots
-        fig.subplots_adjust(hspace=0.4)
-
-        # Key statistics to return
-        stats = {
-            'expected_losses': expected_losses,
-            'expenses': expenses,
-            'underwriting_result': underwriting_result,
-            'investment_income': investment_income,
-            'total_profit': total_profit,
-            'total_assets': total_assets,
-            'total_liabilities': total_liabilities,
-            'capital': capital,
-            'capital_ratio': capital_ratio
-        }
-
-        return fig, stats
+        return plot_balance_sheet(stats, fig), stats
 
     # Original function for compatibility
-    else:
-        # Create figure with three vertically stacked subplots
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 15))
-
-        # Plot 1: Balance Sheet - FIXED VERSION
-        # Create x positions for the two groups of bars - wider spacing for better readability
-        x_pos = [0.3, 1.7]
-
-        # Create the stacked bar for Assets side
-        asset_values = list(assets.values())
-        asset_bottom = 0
-        asset_colors = ['cornflowerblue', 'skyblue']  # Reversed colors for reversed order
-        for i, value in enumerate(asset_values):
-            ax1.bar(x_pos[0], value, bottom=asset_bottom, width=0.8, color=asset_colors[i], alpha=0.7)
-            ax1.text(x_pos[0], asset_bottom + value / 2, f'{list(assets.keys())[i]}\n${value:.1f}M',
-                     ha='center', va='center', fontsize=11)
-            asset_bottom += value
-
-        # Create the stacked bar for Liabilities & Capital side
-        liab_capital_values = list(liabilities.values()) + [capital]
-        liab_capital_colors = ['lightgreen', 'mediumseagreen', 'gold']  # Distinct greens + gold for capital
-        liab_bottom = 0
-        for i, value in enumerate(liab_capital_values):
-            color = liab_capital_colors[i]
-            name = list(liabilities.keys())[i] if i < len(liabilities) else 'Capital (Equity)'
-            ax1.bar(x_pos[1], value, bottom=liab_bottom, width=0.8, color=color, alpha=0.7)
-            ax1.text(x_pos[1], liab_bottom + value / 2, f'{name}\n${value:.1f}M',
-                     ha='center', va='center', fontsize=11)
-            liab_bottom += value
-
-        # Set x-axis labels properly
-        ax1.set_xticks(x_pos)
-        ax1.set_xticklabels(['Assets', 'Liabilities & Capital'])
-
-        ax1.set_title('Balance Sheet (in $ millions)')
-        ax1.set_ylabel('Amount ($ millions)')
-
-        # Add totals adjacent to the bars instead of on top
-        ax1.text(0.35, total_assets * 0.95, f'Total: ${total_assets:.1f}M', ha='left', fontsize=12,
-                 bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.3'))
-        ax1.text(1.35, (total_liabilities + capital) * 0.95, f'Total: ${total_liabilities + capital:.1f}M', ha='left',
-                 fontsize=12,
-                 bbox=dict(facecolor='white', alpha=0.7, boxstyle='round,pad=0.3'))
-
-        # Set limits to make room for the labels
-        ax1.set_ylim(0, total_assets * 1.1)
-        ax1.set_xlim(-0.5, 2.5)
-
-        # Plot 2: Income components
-        income_components = {
-            'Premium': premium_revenue,
-            'Losses': -expected_losses,
-            'Expenses': -expenses,
-            'Investment Income': investment_income,
-            'Profit/Loss': total_profit
-        }
-
-        # Calculate positions for waterfall chart
-        cumulative = 0
-        bottoms = []
-        heights = []
-
-        for name, value in income_components.items():
-            if name == 'Profit/Loss':
-                bottoms.append(0)
-                heights.append(total_profit)
-            else:
-                bottoms.append(cumulative if value > 0 else cumulative + value)
-                heights.append(abs(value))
-                cumulative += value
-
-        # Colors based on positive/negative values
-        colors = ['blue', 'red', 'red', 'green', 'purple' if total_profit >= 0 else 'red']
-
-        # Create waterfall chart
-        bars = ax2.bar(income_components.keys(), heights, bottom=bottoms, color=colors, alpha=0.7)
-
-        # Add values
-        for i, (name, value) in enumerate(income_components.items()):
-            if name == 'Profit/Loss':
-                ax2.text(i, total_profit / 2 if total_profit >= 0 else total_profit / 2,
-                         f'${value:.1f}M', ha='center', va='center', color='white' if abs(value) > 10 else 'black')
-            else:
-                position = bottoms[i] + heights[i] / 2
-                ax2.text(i, position, f'${value:.1f}M', ha='center', va='center',
-                         color='white' if abs(value) > 10 else 'black')
-
-        ax2.set_title('Income Statement (in $ millions)')
-        ax2.set_ylabel('Amount ($ millions)')
-        ax2.grid(axis='y', alpha=0.3)
-
-        # Plot 3: Capital in absolute dollars instead of as a ratio
-        min_capital = premium_revenue * 0.5  # Regulatory minimum capital (50% of premium)
-
-        # Create horizontal bar for capital
-        ax3.barh(['Current Capital'], [capital], color='green' if capital >= min_capital else 'red',
-                 alpha=0.7)
-        ax3.barh(['Minimum Required'], [min_capital], color='red', alpha=0.3)
-
-        ax3.set_title('Capital Requirements (in $ millions)')
-        ax3.set_xlabel('Amount ($ millions)')
-        ax3.set_xlim(0, max(min_capital, capital) * 1.2)
-
-        # Add annotations
-        ax3.text(capital, 0, f'${capital:.1f}M', va='center')
-        ax3.text(min_capital, 1, f'${min_capital:.1f}M (Minimum)', va='center')
-
-        # Add interpretation text
-        status = "ADEQUATE" if capital >= min_capital else "INADEQUATE"
-        color = "green" if capital >= min_capital else "red"
-
-        ax3.text(0.5, 0.5, f"Capital Status: {status}", transform=ax3.transAxes,
-                 ha='center', va='center', fontsize=16, color=color,
-                 bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.5'))
-
-        # Adjust spacing between subplots for better layout
-        plt.subplots_adjust(hspace=0.4)
-        plt.tight_layout()
-        plt.show()
-
-        # Display insurance interpretation
-        print("\nInsurance Interpretation:")
+    import matplotlib.pyplot as plt  # Only the notebook path needs pyplot
+    premium_revenue = stats['premium_revenue']
+    expected_losses = stats['expected_losses']
+    underwriting_result = stats['underwriting_result']
+    investment_income = stats['investment_income']
+    total_profit = stats['total_profit']
+    capital = stats['capital']
+    capital_ratio = stats['capital_ratio']
+    min_capital_ratio = stats['min_capital_ratio']
+
+    # Same figure as the Shiny app, drawn into a pyplot figure so it can be shown
+    plot_balance_sheet(stats, plt.figure(figsize=(12, 15)))
+    plt.show()
+
+    # Display insurance interpretation
+    print("\nInsurance Interpretation:")
+    print(
+        f"• Loss Ratio: {loss_ratio:.2f} (${expected_losses:.1f}M in losses per ${premium_revenue:.1f}M in premium)")
+    print(f"• Underwriting Result: ${underwriting_result:.1f}M")
+    print(f"• Investment Income: ${investment_income:.1f}M")
+    print(f"• Total Profit: ${total_profit:.1f}M")
+    print(f"• Capital: ${capital:.1f}M (Capital Ratio: {capital_ratio:.2f})")
+
+    if capital_ratio < min_capital_ratio:
+        print(f"• ALERT: Capital ratio is below the regulatory minimum of {min_capital_ratio:.2f}!")
         print(
-            f"• Loss Ratio: {loss_ratio:.2f} (${expected_losses:.1f}M in losses per ${premium_revenue:.1f}M in premium)")
-        print(f"• Underwriting Result: ${underwriting_result:.1f}M")
-        print(f"• Investment Income: ${investment_income:.1f}M")
-        print(f"• Total Profit: ${total_profit:.1f}M")
-        print(f"• Capital: ${capital:.1f}M (Capital Ratio: {capital_ratio:.2f})")
-
-        if capital_ratio < min_capital_ratio:
-            print(f"• ALERT: Capital ratio is below the regulatory minimum of {min_capital_ratio:.2f}!")
-            print(
-                f"• The company needs at least ${(min_capital_ratio * premium_revenue - capital):.1f}M more capital to meet minimum requirements.")
-        else:
-            surplus = capital - (min_capital_ratio * premium_revenue)
-            print(f"• The company has ${surplus:.1f}M of capital surplus above the regulatory minimum.")
\ No newline at end of file
+            f"• The company needs at least ${(min_capital_ratio * premium_revenue - capital):.1f}M more capital to meet minimum requirements.")
+    else:
+        surplus = capital - (min_capital_ratio * premium_revenue)
+        print(f"• The company has ${surplus:.1f}M of capital surplus above the regulatory minimum.")
\ No newline at end of file
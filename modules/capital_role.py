@@ -1,12 +1,149 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-from matplotlib.figure import Figure
+from functools import lru_cache
+from .plotting import FixedMarginLayoutEngine, prepare_figure, store_artists, stored_artists
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    # numba is optional - without it the simulation is vectorized with NumPy instead
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+    _HAVE_NUMBA = False
+
+# Base parameters
+ANNUAL_PREMIUM = 100.0  # $100M annual premium - consistent with balance sheet
+EXPECTED_LOSS_RATIO = 0.65  # Expected losses are 65% of premium
+EXPENSE_RATIO = 0.30  # Expenses are 30% of premium
+INVESTMENT_RETURN = 0.05  # 5% annual return on investments
+
+# Key statistics text box style, built once and copied by each text artist
+STATS_BBOX = dict(boxstyle='round', facecolor='wheat', alpha=0.7)
+
+# Subplot margins in inches, in place of a tight layout solve on every render
+FIGURE_LAYOUT = FixedMarginLayoutEngine(left=0.75, right=0.2, top=0.4, bottom=0.65, gap=0.45)
+
+
+# Explicit signature: compiled (or loaded from cache) at import, so the
+# first simulation request never waits on the JIT
+@njit("Tuple((int64[:], float64[:]))(float64[:, :], float64, float64, float64, float64)", parallel=True, cache=True)
+def _simulate_companies(loss_ratios, initial_capital, annual_premium, expense_ratio, investment_return):
+    """
+    Runs the year-by-year capital path of each simulated company
 
+    Parameters:
+    -----------
+    loss_ratios : numpy.ndarray
+        Loss ratio for each (simulation, year), shape (num_simulations, num_years)
+    initial_capital : float
+        Starting capital in millions
+    annual_premium : float
+        Premium written each year in millions
+    expense_ratio : float
+        Expenses as a fraction of premium
+    investment_return : float
+        Annual return earned on beginning-of-year capital
 
-def demonstrate_capital_role(capital_amount=50, num_years=10, seed=42, return_fig=False):
+    Returns:
+    --------
+    years_survived : numpy.ndarray
+        Last year each company started with positive capital
+    final_capital : numpy.ndarray
+        Capital at the end of the simulation (or at bankruptcy)
     """
-    Demonstrates how capital protects an insurance company from bankruptcy
+    num_simulations, num_years = loss_ratios.shape
+    years_survived = np.zeros(num_simulations, dtype=np.int64)
+    final_capital = np.empty(num_simulations)
+    expenses = annual_premium * expense_ratio  # Same every year
+
+    # Companies are independent, so they are split across threads
+    for sim in prange(num_simulations):
+        # Start with initial values
+        capital = initial_capital
+
+        # Run simulation for specified number of years or until bankruptcy
+        for year in range(num_years):
+            if capital <= 0:
+                break
+
+            # Calculate this year's underwriting result
+            losses = annual_premium * loss_ratios[sim, year]
+            underwriting_profit = annual_premium - losses - expenses
+
+            # Apply investment return to beginning capital
+            investment_income = capital * investment_return
+
+            # Update capital
+            capital += underwriting_profit + investment_income
+            years_survived[sim] = year + 1
+
+        final_capital[sim] = capital
+
+    return years_survived, final_capital
+
+
+def _simulate_companies_vectorized(loss_ratios, initial_capital, annual_premium, expense_ratio, investment_return):
+    """
+    Runs the same capital paths as _simulate_companies, stepping every company
+    through each year at once with NumPy
+
+    Used when numba is not installed. The per-company arithmetic matches the
+    kernel operation for operation, so both return identical results.
+
+    Parameters:
+    -----------
+    loss_ratios : numpy.ndarray
+        Loss ratio for each (simulation, year), shape (num_simulations, num_years)
+    initial_capital : float
+        Starting capital in millions
+    annual_premium : float
+        Premium written each year in millions
+    expense_ratio : float
+        Expenses as a fraction of premium
+    investment_return : float
+        Annual return earned on beginning-of-year capital
+
+    Returns:
+    --------
+    years_survived : numpy.ndarray
+        Last year each company started with positive capital
+    final_capital : numpy.ndarray
+        Capital at the end of the simulation (or at bankruptcy)
+    """
+    num_simulations, num_years = loss_ratios.shape
+    years_survived = np.zeros(num_simulations, dtype=np.int64)
+    capital = np.full(num_simulations, initial_capital)
+    expenses = annual_premium * expense_ratio  # Same every year
+
+    # Underwriting result of every company in every year
+    underwriting_profit = annual_premium - annual_premium * loss_ratios - expenses
+
+    for year in range(num_years):
+        # Bankrupt companies stop trading and keep their final capital
+        solvent = capital > 0
+        if not solvent.any():
+            break
+
+        # Apply investment return to beginning capital
+        investment_income = capital * investment_return
+        capital = np.where(solvent, capital + (underwriting_profit[:, year] + investment_income), capital)
+        years_survived[solvent] = year + 1
+
+    return years_survived, capital
+
+
+@lru_cache(maxsize=256)
+def compute_capital_role(capital_amount=50, num_years=10, seed=42):
+    """
+    Runs the multi-year solvency simulation behind the capital demonstration
+
+    Results are cached on (capital_amount, num_years, seed), so repeated calls
+    with the same slider values skip the Monte Carlo. The returned dict is
+    shared between callers and must not be modified.
 
     Parameters:
     -----------
@@ -16,251 +153,307 @@ def demonstrate_capital_role(capital_amount=50, num_years=10, seed=42, return_fi
         Number of years to simulate
     seed : int
         Random seed for reproducibility
-    return_fig : bool
-        If True, returns the figure and stats for Shiny integration
 
     Returns:
     --------
-    fig : matplotlib.figure.Figure
-        The figure object (if return_fig is True)
     stats : dict
-        Key statistics (if return_fig is True)
+        Key statistics, plus the per-simulation results used for plotting
     """
-    # Use the provided seed for consistent results
-    np.random.seed(seed)
-
-    # Base parameters
-    annual_premium = 100.0  # $100M annual premium - consistent with balance sheet
-    expected_loss_ratio = 0.65  # Expected losses are 65% of premium
-    expense_ratio = 0.30  # Expenses are 30% of premium
-    investment_return = 0.05  # 5% annual return on investments
+    # Use the provided seed for consistent results, without touching the global NumPy state
+    rng = np.random.default_rng(seed)
 
     # Calculate capital amount based on selected amount in millions
     initial_capital = capital_amount
-    capital_ratio = initial_capital / annual_premium
+    capital_ratio = initial_capital / ANNUAL_PREMIUM
 
     # Run more simulations for better consistency
     num_simulations = 500
-    results = []
 
-    for sim in range(num_simulations):
-        # Start with initial values
-        capital = initial_capital
-        years_survived = 0
+    # Generate random loss ratios for every company and year up front (normally distributed around expected)
+    # Standard deviation of 0.15 means about 1/3 of years have loss ratios above 80% or below 50%
+    # Scaled and floored in place, so the draw is the only allocation
+    loss_ratios = rng.standard_normal((num_simulations, num_years))
+    loss_ratios *= 0.15
+    loss_ratios += EXPECTED_LOSS_RATIO
+    np.maximum(loss_ratios, 0.2, out=loss_ratios)  # Floor at 20%
 
-        # Run simulation for specified number of years or until bankruptcy
-        for year in range(1, num_years + 1):
-            if capital <= 0:
-                break
+    # Simulate each company's capital path
+    simulate = _simulate_companies if _HAVE_NUMBA else _simulate_companies_vectorized
+    years_survived, final_capital = simulate(
+        loss_ratios, float(initial_capital), ANNUAL_PREMIUM, EXPENSE_RATIO, INVESTMENT_RETURN
+    )
 
-            # Generate random loss ratio for this year (normally distributed around expected)
-            # Standard deviation of 0.15 means about 1/3 of years have loss ratios above 80% or below 50%
-            actual_loss_ratio = np.random.normal(expected_loss_ratio, 0.15)
-            actual_loss_ratio = max(0.2, actual_loss_ratio)  # Floor at 20%
+    # Calculate statistics
+    survival_rate = np.count_nonzero(years_survived >= num_years) / num_simulations
+    average_years = years_survived.mean()
+    # Average over the companies still solvent at the end (undefined if none are)
+    solvent = final_capital > 0
+    average_final_capital = final_capital[solvent].mean() if solvent.any() else np.nan
+
+    # Read-only, since the cached arrays are handed to every caller
+    years_survived.flags.writeable = False
+    final_capital.flags.writeable = False
+
+    return {
+        'capital_amount': capital_amount,
+        'initial_capital': initial_capital,
+        'num_years': num_years,
+        'survival_rate': survival_rate,
+        'average_years': average_years,
+        'average_final_capital': average_final_capital,
+        'annual_premium': ANNUAL_PREMIUM,
+        'capital_ratio': capital_ratio,
+        'num_simulations': num_simulations,
+        'years_survived': years_survived,
+        'final_capital': final_capital,
+        'seed': seed  # Include seed in stats
+    }
+
+
+def _draw_survival_pie(ax, stats):
+    """Draws the survived/failed pie chart of the capital role figure"""
+    num_years = stats['num_years']
+    survived = int(np.count_nonzero(stats['years_survived'] >= num_years))
+    ax.pie(
+        [survived, len(stats['years_survived']) - survived],
+        labels=[f'Survived all {num_years} years', 'Failed before year ' + str(num_years)],
+        colors=['green', 'red'], autopct='%1.1f%%', startangle=90,
+        explode=(0.1, 0), textprops={'fontsize': 12}
+    )
+    ax.set_title(f'Survival Rate with ${stats["capital_amount"]:.1f}M Initial Capital', fontsize=14)
+
+
+def _survival_bins(num_years):
+    """Returns the histogram bins and x ticks for the years survived plot"""
+    if num_years <= 25:
+        # For smaller year ranges, use every year
+        bins = np.arange(0.5, num_years + 1.5, 1)
+        xticks = range(1, num_years + 1)
+    else:
+        # For larger year ranges, use bins at 5-year intervals
+        bins = np.arange(0.5, num_years + 1.5, 5)  # Bins every 5 years
+        xticks = range(5, num_years + 1, 5)  # Show labels every 5 years
+    return bins, xticks
 
-            # Calculate this year's underwriting result
-            losses = annual_premium * actual_loss_ratio
-            expenses = annual_premium * expense_ratio
-            underwriting_profit = annual_premium - losses - expenses
 
-            # Apply investment return to beginning capital
-            investment_income = capital * investment_return
+def _stats_text(stats):
+    """Returns the key statistics text box of the capital role figure"""
+    return f"Initial Capital: ${stats['initial_capital']:.1f}M\n" \
+           f"Annual Premium: ${stats['annual_premium']:.1f}M\n" \
+           f"Capital Ratio: {stats['capital_ratio']:.1f}x Premium\n" \
+           f"Survival Rate (All {stats['num_years']} Years): {stats['survival_rate']:.1%}\n" \
+           f"Average Survival: {stats['average_years']:.1f} years"
 
-            # Update capital
-            capital += underwriting_profit + investment_income
-            years_survived = year
 
-        # Store results of this simulation
-        results.append({
-            'survived_years': years_survived,
-            'final_capital': capital
-        })
+def _update_capital_role(artists, stats):
+    """Moves the artists of an existing capital role figure to new statistics"""
+    average_years = stats['average_years']
 
-    # Calculate statistics
-    years_survived = [r['survived_years'] for r in results]
-    final_capital = [r['final_capital'] for r in results]
+    # Plot 1: the two-wedge pie is cheap to redraw, and its label placement is
+    # computed by pie() itself
+    artists['ax1'].clear()
+    _draw_survival_pie(artists['ax1'], stats)
 
-    survival_rate = sum(1 for y in years_survived if y >= num_years) / num_simulations
-    average_years = np.mean(years_survived)
-    average_final_capital = np.mean([c for c in final_capital if c > 0])
+    # Plot 2: same bins, so only the bar heights and the average move
+    counts, _ = np.histogram(stats['years_survived'], bins=artists['bins'])
+    for patch, count in zip(artists['bars'], counts):
+        patch.set_height(count)
+    label = f'Average: {average_years:.1f} years'
+    artists['average_line'].set_xdata([average_years, average_years])
+    artists['average_line'].set_label(label)
+    artists['ax2'].get_legend().get_texts()[0].set_text(label)
+    artists['ax2'].relim()
+    artists['ax2'].autoscale_view()
+
+    artists['stats_text'].set_text(_stats_text(stats))
+
+
+def plot_capital_role(stats, fig=None):
+    """
+    Builds the capital role figure from precomputed statistics
+
+    When fig was previously drawn by this function for the same number of
+    years, its histogram, average line and text are updated in place instead
+    of rebuilding the figure.
+
+    Parameters:
+    -----------
+    stats : dict
+        Statistics returned by compute_capital_role
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to update or redraw into instead of creating a new one
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object
+    """
+    num_years = stats['num_years']
+    average_years = stats['average_years']
+    years_survived = stats['years_survived']
+
+    artists = stored_artists(fig, 'plot_capital_role')
+    if artists is not None and artists['num_years'] == num_years:
+        _update_capital_role(artists, stats)
+        return fig
+
+    # Create figure
+    fig = prepare_figure(fig, figsize=(12, 12))
+
+    # Create subplots
+    ax1 = fig.add_subplot(211)
+    ax2 = fig.add_subplot(212)
+
+    # Plot 1: Survival distribution
+    _draw_survival_pie(ax1, stats)
+
+    # Plot 2: Years survived histogram
+    bins, xticks = _survival_bins(num_years)
+
+    # Binned once with NumPy and drawn as plain bars, as ax.hist would
+    counts, edges = np.histogram(years_survived, bins=bins)
+    bars = ax2.bar(0.5 * (edges[:-1] + edges[1:]), counts, width=np.diff(edges),
+                   color='blue', alpha=0.7, edgecolor='black')
+    ax2.set_xticks(xticks)
+    ax2.set_xlabel('Years Survived', fontsize=12)
+    ax2.set_ylabel('Number of Companies', fontsize=12)
+    ax2.set_title('Distribution of Survival Years', fontsize=14)
+
+    # Add a vertical line for average
+    average_line = ax2.axvline(average_years, color='red', linestyle='--',
+                               label=f'Average: {average_years:.1f} years')
+    ax2.legend(fontsize=12)
+
+    # Add text box with key statistics
+    stats_text = fig.text(0.95, 0.45, _stats_text(stats), fontsize=12,
+                          verticalalignment='top', horizontalalignment='right',
+                          bbox=STATS_BBOX)
+
+    # Margins measured from tight layout across the slider ranges
+    fig.set_layout_engine(FIGURE_LAYOUT)
+
+    store_artists(fig, 'plot_capital_role', {
+        'ax1': ax1,
+        'ax2': ax2,
+        'num_years': num_years,
+        'bins': bins,
+        'bars': bars,
+        'average_line': average_line,
+        'stats_text': stats_text,
+    })
+
+    return fig
+
+
+def demonstrate_capital_role(capital_amount=50, num_years=10, seed=42, return_fig=False, fig=None):
+    """
+    Demonstrates how capital protects an insurance company from bankruptcy
+
+    Parameters:
+    -----------
+    capital_amount : float
+        Initial capital in millions
+    num_years : int
+        Number of years to simulate
+    seed : int
+        Random seed for reproducibility
+    return_fig : bool
+        If True, returns the figure and stats for Shiny integration
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to redraw into when return_fig is True
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object (if return_fig is True)
+    stats : dict
+        Key statistics (if return_fig is True)
+    """
+    stats = compute_capital_role(capital_amount, num_years, seed)
 
     # For Shiny integration
     if return_fig:
-        # Create figure
-        fig = Figure(figsize=(12, 12))
-
-        # Create subplots
-        ax1 = fig.add_subplot(211)
-        ax2 = fig.add_subplot(212)
-
-        # Plot 1: Survival distribution
-        survived = [y >= num_years for y in years_survived]
-        wedges, texts, autotexts = ax1.pie(
-            [sum(survived), len(survived) - sum(survived)],
-            labels=[f'Survived all {num_years} years', 'Failed before year ' + str(num_years)],
-            colors=['green', 'red'], autopct='%1.1f%%', startangle=90,
-            explode=(0.1, 0), textprops={'fontsize': 12}
-        )
-        ax1.set_title(f'Survival Rate with ${capital_amount:.1f}M Initial Capital', fontsize=14)
-
-        # Plot 2: Years survived histogram
-        if num_years <= 25:
-            # For smaller year ranges, use every year
-            bins = np.arange(0.5, num_years + 1.5, 1)
-            xticks = range(1, num_years + 1)
-        else:
-            # For larger year ranges, use bins at 5-year intervals
-            bins = np.arange(0.5, num_years + 1.5, 5)  # Bins every 5 years
-            xticks = range(5, num_years + 1, 5)  # Show labels every 5 years
-
-        ax2.hist(years_survived, bins=bins, color='blue', alpha=0.7, edgecolor='black')
-        ax2.set_xticks(xticks)
-        ax2.set_xlabel('Years Survived', fontsize=12)
-        ax2.set_ylabel('Number of Companies', fontsize=12)
-        ax2.set_title('Distribution of Survival Years', fontsize=14)
-
-        # Add a vertical line for average
-        ax2.axvline(average_years, color='red', linestyle='--',
-                    label=f'Average: {average_years:.1f} years')
-        ax2.legend(fontsize=12)
-
-        # Add text box with key statistics
-        stats_text = f"Initial Capital: ${initial_capital:.1f}M\n" \
-                     f"Annual Premium: ${annual_premium:.1f}M\n" \
-                     f"Capital Ratio: {capital_ratio:.1f}x Premium\n" \
-                     f"Survival Rate (All {num_years} Years): {survival_rate:.1%}\n" \
-                     f"Average Survival: {average_years:.1f} years"
-
-        fig.text(0.95, 0.45, stats_text, fontsize=12,
-                 verticalalignment='top', horizontalalignment='right',
-                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.7))
-
-        # Adjust spacing between subplots
-        fig.subplots_adjust(hspace=0.3)
-
-        # Key statistics to return
-        stats = {
-            'capital_amount': capital_amount,
-            'initial_capital': initial_capital,
-            'num_years': num_years,
-            'survival_rate': survival_rate,
-            'average_years': average_years,
-            'average_final_capital': average_final_capital,
-            'seed': seed  # Include seed in stats
-        }
-
-        return fig, stats
+        return plot_capital_role(stats, fig), stats
 
     # Original function for compatibility
+    import matplotlib.pyplot as plt  # Only the notebook path needs pyplot
+    capital_ratio = stats['capital_ratio']
+    num_simulations = stats['num_simulations']
+    survival_rate = stats['survival_rate']
+    years_survived = stats['years_survived']
+
+    # Same figure as the Shiny app, restacked into three rows so the survival
+    # curve is drawn below it in the same figure
+    fig = plot_capital_role(stats, plt.figure(figsize=(12, 18)))
+    ax1, ax2 = fig.axes
+    for ax in (ax1, ax2):
+        ax.set_title(f'{ax.get_title()} (Seed: {seed})', fontsize=14)
+    gs = fig.add_gridspec(3, 1)
+    ax1.set_subplotspec(gs[0])
+    ax2.set_subplotspec(gs[1])
+    ax3 = fig.add_subplot(gs[2])
+
+    # The key statistics box moves onto the survival curve, as a single box per figure
+    stored_artists(fig, 'plot_capital_role')['stats_text'].remove()
+
+    # Calculate survival curve: share of companies still trading at the start of each year,
+    # from a reverse cumulative count of the years each one survived
+    survived_counts = np.bincount(years_survived, minlength=num_years + 1)
+    still_trading = np.cumsum(survived_counts[::-1])[::-1]
+    survival_curve = still_trading[1:num_years + 1] / num_simulations
+
+    # Handle labeling differently based on number of years
+    if num_years <= 25:
+        # For smaller year ranges, show every year
+        years_to_show = range(1, num_years + 1)
+
+        # Plot every year point
+        ax3.plot(years_to_show, survival_curve, 'bo-', linewidth=2, markersize=8)
+
+        # Add annotations (every year)
+        for year, rate in enumerate(survival_curve, 1):
+            ax3.annotate(f'{rate:.0%}', (year, rate), textcoords="offset points",
+                         xytext=(0, 10), ha='center', fontsize=10)
+    else:
+        # Plot a smooth line using all years
+        ax3.plot(range(1, num_years + 1), survival_curve, 'b-', linewidth=2)
+
+        # Plot markers only at 5-year intervals
+        years_to_show = range(5, num_years + 1, 5)
+        markers_survival = [survival_curve[y - 1] for y in years_to_show]
+        ax3.plot(years_to_show, markers_survival, 'bo', markersize=8)
+
+        # Add annotations (every 5 years)
+        for i, year in enumerate(years_to_show):
+            rate = markers_survival[i]
+            ax3.annotate(f'{rate:.0%}', (year, rate), textcoords="offset points",
+                         xytext=(0, 10), ha='center', fontsize=10)
+
+    # Add text box with key statistics - fixed at top-right for consistency
+    ax3.text(0.95, 0.95, _stats_text(stats) + f"\nSimulation Seed: {seed}", transform=ax3.transAxes,
+             fontsize=12, verticalalignment='top', horizontalalignment='right',
+             bbox=STATS_BBOX)
+
+    ax3.set_title(f'Survival Curve (Seed: {seed})', fontsize=14)
+    ax3.set_xlabel('Year', fontsize=12)
+    ax3.set_ylabel('Survival Probability', fontsize=12)
+    ax3.grid(True, alpha=0.3)
+
+    # One layout solve and one show for all three plots
+    fig.set_layout_engine('tight')
+    plt.show()
+
+    # Display insurance interpretation
+    print("\nInsurance Interpretation:")
+    print(f"• Simulation Seed: {seed}")
+    print(f"• Capital serves as a buffer against unexpected losses.")
+    print(
+        f"• With ${capital_amount:.1f}M of initial capital ({capital_ratio:.1f}x annual premium), {survival_rate:.1%} of companies survived all {num_years} years.")
+    print(f"• Higher capital amounts mean better protection against insolvency.")
+    print(f"• Insurance regulators require minimum capital levels to ensure companies can pay claims.")
+
+    if survival_rate < 0.90:
+        print(f"• Warning: This capital level may be inadequate for long-term stability.")
+        print(f"• Recommendation: Increase capital to improve survival probability.")
     else:
-        # Create figure - stacked vertically for better readability
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 12))
-
-        # Plot 1: Survival distribution
-        survived = [y >= num_years for y in years_survived]
-        ax1.pie([sum(survived), len(survived) - sum(survived)],
-                labels=[f'Survived all {num_years} years', 'Failed before year ' + str(num_years)],
-                colors=['green', 'red'], autopct='%1.1f%%', startangle=90,
-                explode=(0.1, 0), textprops={'fontsize': 12})
-        ax1.set_title(f'Survival Rate with ${capital_amount:.1f}M Initial Capital (Seed: {seed})', fontsize=14)
-
-        # Plot 2: Years survived histogram - Adjust bins and labels based on years
-        if num_years <= 25:
-            # For smaller year ranges, use every year
-            bins = np.arange(0.5, num_years + 1.5, 1)
-            xticks = range(1, num_years + 1)
-        else:
-            # For larger year ranges, use bins at 5-year intervals
-            bins = np.arange(0.5, num_years + 1.5, 5)  # Bins every 5 years
-            xticks = range(5, num_years + 1, 5)  # Show labels every 5 years
-
-        ax2.hist(years_survived, bins=bins, color='blue', alpha=0.7, edgecolor='black')
-        ax2.set_xticks(xticks)
-        ax2.set_xlabel('Years Survived', fontsize=12)
-        ax2.set_ylabel('Number of Companies', fontsize=12)
-        ax2.set_title(f'Distribution of Survival Years (Seed: {seed})', fontsize=14)
-
-        # Add a vertical line for average
-        ax2.axvline(average_years, color='red', linestyle='--',
-                    label=f'Average: {average_years:.1f} years')
-        ax2.legend(fontsize=12)
-
-        # Adjust spacing between subplots
-        plt.subplots_adjust(hspace=0.3)
-        plt.tight_layout()
-        plt.show()
-
-        # Display survival curve with adjusted labels for large year ranges
-        plt.figure(figsize=(12, 6))
-
-        # Calculate survival curve
-        survival_counts = []
-
-        # Handle labeling differently based on number of years
-        if num_years <= 25:
-            # For smaller year ranges, calculate and show every year
-            years_to_show = range(1, num_years + 1)
-            for year in years_to_show:
-                survival_counts.append(sum(1 for y in years_survived if y >= year) / num_simulations)
-
-            # Plot every year point
-            plt.plot(years_to_show, survival_counts, 'bo-', linewidth=2, markersize=8)
-
-            # Add annotations (every year)
-            for year, rate in enumerate(survival_counts, 1):
-                plt.annotate(f'{rate:.0%}', (year, rate), textcoords="offset points",
-                             xytext=(0, 10), ha='center', fontsize=10)
-        else:
-            # For larger year ranges, calculate every year but show every 5 years
-            full_survival_counts = []
-            for year in range(1, num_years + 1):
-                full_survival_counts.append(sum(1 for y in years_survived if y >= year) / num_simulations)
-
-            # Plot a smooth line using all years
-            plt.plot(range(1, num_years + 1), full_survival_counts, 'b-', linewidth=2)
-
-            # Plot markers only at 5-year intervals
-            years_to_show = range(5, num_years + 1, 5)
-            markers_survival = [full_survival_counts[y - 1] for y in years_to_show]
-            plt.plot(years_to_show, markers_survival, 'bo', markersize=8)
-
-            # Add annotations (every 5 years)
-            for i, year in enumerate(years_to_show):
-                rate = markers_survival[i]
-                plt.annotate(f'{rate:.0%}', (year, rate), textcoords="offset points",
-                             xytext=(0, 10), ha='center', fontsize=10)
-
-        # Add text box with key statistics - fixed at top-right for consistency
-        stats_text = f"Initial Capital: ${initial_capital:.1f}M\n" \
-                     f"Annual Premium: ${annual_premium:.1f}M\n" \
-                     f"Capital Ratio: {capital_ratio:.1f}x Premium\n" \
-                     f"Survival Rate (All {num_years} Years): {survival_rate:.1%}\n" \
-                     f"Average Survival: {average_years:.1f} years\n" \
-                     f"Simulation Seed: {seed}"
-
-        # Simple positioning at top-right
-        plt.text(0.95, 0.95, stats_text, transform=plt.gca().transAxes, fontsize=12,
-                 verticalalignment='top', horizontalalignment='right',
-                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.7))
-
-        plt.title(f'Survival Curve (Seed: {seed})', fontsize=14)
-        plt.xlabel('Year', fontsize=12)
-        plt.ylabel('Survival Probability', fontsize=12)
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.show()
-
-        # Display insurance interpretation
-        print("\nInsurance Interpretation:")
-        print(f"• Simulation Seed: {seed}")
-        print(f"• Capital serves as a buffer against unexpected losses.")
-        print(
-            f"• With ${capital_amount:.1f}M of initial capital ({capital_ratio:.1f}x annual premium), {survival_rate:.1%} of companies survived all {num_years} years.")
-        print(f"• Higher capital amounts mean better protection against insolvency.")
-        print(f"• Insurance regulators require minimum capital levels to ensure companies can pay claims.")
-
-        if survival_rate < 0.90:
-            print(f"• Warning: This capital level may be inadequate for long-term stability.")
-            print(f"• Recommendation: Increase capital to improve survival probability.")
-        else:
-            print(f"• This capital level appears adequate with a high survival probability.")
\ No newline at end of file
+        print(f"• This capital level appears adequate with a high survival probability.")
\ No newline at end of file
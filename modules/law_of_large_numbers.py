@@ -1,10 +1,273 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-from matplotlib.figure import Figure
+from functools import lru_cache
+from matplotlib.ticker import FuncFormatter
+from .plotting import prepare_figure, store_artists, stored_artists
 
+# Create sample sizes (increasing exponentially)
+SAMPLE_SIZES = np.array([10, 50, 100, 500, 1000, 5000, 10000, 50000], dtype=np.int64)
+SAMPLE_SIZES.flags.writeable = False  # Shared through every stats dict
 
-def demonstrate_law_of_large_numbers(true_probability=0.05, seed=42, return_fig=False):
+
+def _simulate_observed_rates(true_probability, seed):
+    """Returns the observed accident rate at each of SAMPLE_SIZES for one seeded run"""
+    # Run experiment - simulate one population of drivers and look at the first
+    # `size` of them, so each larger sample extends the smaller ones
+    rng = np.random.default_rng(seed)
+
+    # Accidents among the drivers each sample adds to the previous one are binomial,
+    # so the counts are drawn directly instead of simulating every driver
+    new_drivers = np.diff(SAMPLE_SIZES, prepend=0)
+    return np.cumsum(rng.binomial(new_drivers, true_probability)) / SAMPLE_SIZES
+
+
+@lru_cache(maxsize=256)
+def compute_law_of_large_numbers(true_probability=0.05, seed=42):
+    """
+    Runs the accident simulation behind the Law of Large Numbers demonstration
+
+    Results are cached on (true_probability, seed), so repeated calls with the
+    same slider values skip the simulation. The returned dict is shared between
+    callers and must not be modified.
+
+    Parameters:
+    -----------
+    true_probability : float
+        The true probability of an accident
+    seed : int
+        Random seed for reproducibility
+
+    Returns:
+    --------
+    stats : dict
+        Key statistics, plus the per-sample-size results used for plotting
+    """
+    observed = _simulate_observed_rates(true_probability, seed)
+    errors = np.abs(observed - true_probability)
+    # Read-only, since the cached arrays are handed to every caller
+    observed.flags.writeable = False
+    errors.flags.writeable = False
+
+    # Per-size records, kept for callers that read stats['results']
+    results = [{
+        'sample_size': size,
+        'observed_probability': observed_probability,
+        'true_probability': true_probability,
+        'error': error
+    } for size, observed_probability, error in zip(SAMPLE_SIZES.tolist(), observed, errors)]
+
+    return {
+        'small_sample': observed[0],
+        'medium_sample': observed[5],
+        'large_sample': observed[7],
+        'small_error': errors[0],
+        'medium_error': errors[5],
+        'large_error': errors[7],
+        'true_probability': true_probability,
+        'sample_sizes': SAMPLE_SIZES,
+        'observed': observed,
+        'errors': errors,
+        'results': results,
+        'seed': seed  # Include seed in stats
+    }
+
+
+def demonstrate_many(seeds, true_probability=0.05):
+    """
+    Runs the Law of Large Numbers simulation once for each of many seeds
+
+    Meant for sweeps such as classroom animations or sensitivity studies: no
+    figures are drawn and nothing is cached. Row i holds the same observed
+    rates as compute_law_of_large_numbers(true_probability, seeds[i]).
+
+    Parameters:
+    -----------
+    seeds : iterable of int
+        Random seeds, one simulation per seed
+    true_probability : float
+        The true probability of an accident
+
+    Returns:
+    --------
+    observed : numpy.ndarray
+        Observed accident rates, shape (len(seeds), len(SAMPLE_SIZES))
+    """
+    return np.array([_simulate_observed_rates(true_probability, seed) for seed in seeds]).reshape(-1, len(SAMPLE_SIZES))
+
+
+def _observed_rate_limits(true_probability, smallest_sample):
+    """Returns fixed y-axis limits for the observed accident rate plot"""
+    # Set fixed y-axis scale based on 90% confidence interval for the smallest sample (10 drivers)
+    # Using normal approximation to binomial with continuity correction
+    p = true_probability
+    # Z-score for 90% confidence is 1.645
+    z_score = 1.645
+
+    # Calculate confidence interval bounds for the smallest sample
+    # Formula: p ± z * sqrt(p(1-p)/n)
+    ci_width = z_score * np.sqrt(p * (1 - p) / smallest_sample)
+    lower_bound = max(0, p - ci_width)
+    upper_bound = min(1, p + ci_width)
+
+    # Set y-axis with some padding to ensure all points are visible
+    padding = 0.05  # 5% padding
+    y_min = max(0, lower_bound - padding)
+    y_max = min(1, upper_bound + padding)
+
+    # Ensure the y-axis always includes the true probability
+    y_min = min(y_min, true_probability * 0.5)
+    y_max = max(y_max, true_probability * 1.5)
+
+    return y_min, y_max
+
+
+def _format_sample_size(x, pos):
+    """Formats a sample size tick label without scientific notation, using commas for thousands"""
+    if x >= 1000:
+        return f'{x:,.0f}'  # Use commas for thousands
+    return f'{x:.0f}'
+
+
+def _format_error_value(y, pos):
+    """Formats an error tick label, showing more decimal places for small values"""
+    if y < 0.001:
+        return f'{y:.4f}'
+    elif y < 0.01:
+        return f'{y:.3f}'
+    else:
+        return f'{y:.2f}'
+
+
+def _update_law_of_large_numbers(artists, stats):
+    """Moves the artists of an existing Law of Large Numbers figure to new statistics"""
+    true_probability = stats['true_probability']
+    sample_sizes = stats['sample_sizes']
+    observed = stats['observed']
+    errors = stats['errors']
+
+    # Plot 1: Observed probability vs sample size
+    artists['observed_line'].set_ydata(observed)
+    label = f'True probability: {true_probability:.1%}'
+    artists['true_line'].set_ydata([true_probability, true_probability])
+    artists['true_line'].set_label(label)
+    artists['ax1'].get_legend().get_texts()[0].set_text(label)
+    artists['ax1'].set_ylim(*_observed_rate_limits(true_probability, sample_sizes[0]))
+    for annotation, size, value in zip(artists['observed_labels'], sample_sizes, observed):
+        annotation.xy = (size, value)
+        annotation.set_text(f"{value:.1%}")
+
+    # Plot 2: Error vs sample size
+    artists['error_line'].set_ydata(errors)
+    artists['ax2'].set_ylim(0, errors.max() * 1.2)
+    for annotation, size, value in zip(artists['error_labels'], sample_sizes, errors):
+        annotation.xy = (size, value)
+        annotation.set_text(f"{value:.3f}")
+
+
+def plot_law_of_large_numbers(stats, fig=None):
+    """
+    Builds the Law of Large Numbers figure from precomputed statistics
+
+    When fig was previously drawn by this function, its lines, labels and axis
+    limits are updated in place instead of rebuilding the figure.
+
+    Parameters:
+    -----------
+    stats : dict
+        Statistics returned by compute_law_of_large_numbers
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to update or redraw into instead of creating a new one
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object
+    """
+    artists = stored_artists(fig, 'plot_law_of_large_numbers')
+    if artists is not None:
+        _update_law_of_large_numbers(artists, stats)
+        return fig
+
+    true_probability = stats['true_probability']
+    sample_sizes = stats['sample_sizes']
+    observed = stats['observed']
+    errors = stats['errors']
+
+    # Create the plot
+    fig = prepare_figure(fig, figsize=(14, 6))
+
+    # Create subplots
+    ax1 = fig.add_subplot(121)
+    ax2 = fig.add_subplot(122)
+
+    # Plot 1: Observed probability vs sample size
+    observed_line, = ax1.semilogx(sample_sizes, observed, 'bo-', linewidth=2, markersize=8)
+    true_line = ax1.axhline(true_probability, color='red', linestyle='--',
+                            label=f'True probability: {true_probability:.1%}')
+    ax1.set_xlabel('Number of Drivers')
+    ax1.set_ylabel('Observed Accident Rate')
+    ax1.set_title(f'Observed Accident Rate vs. Sample Size')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend()
+
+    # Format x-tick labels to avoid scientific notation and use commas
+    ax1.xaxis.set_major_formatter(FuncFormatter(_format_sample_size))
+
+    # Set y-axis limits
+    ax1.set_ylim(*_observed_rate_limits(true_probability, sample_sizes[0]))
+
+    # Add text annotations for each point
+    observed_labels = []
+    for size, value in zip(sample_sizes, observed):
+        observed_labels.append(ax1.annotate(f"{value:.1%}",
+                                            (size, value),
+                                            textcoords="offset points",
+                                            xytext=(0, 10),
+                                            ha='center'))
+
+    # Plot 2: Error vs sample size - using semilogx (log scale for x, linear for y)
+    # This allows us to include 0 on the y-axis
+    error_line, = ax2.semilogx(sample_sizes, errors, 'ro-', linewidth=2, markersize=8)
+    ax2.set_xlabel('Number of Drivers')
+    ax2.set_ylabel('Error (|Observed - True|)')
+    ax2.set_title(f'Error vs. Sample Size')
+    ax2.grid(True, alpha=0.3)
+
+    # Format x-tick labels to avoid scientific notation and use commas
+    ax2.xaxis.set_major_formatter(FuncFormatter(_format_sample_size))
+
+    # Format y-tick labels to show more decimal places for small values
+    ax2.yaxis.set_major_formatter(FuncFormatter(_format_error_value))
+
+    # Set y-axis to start from 0
+    y_max = errors.max() * 1.2  # Add 20% to the max for clarity
+    ax2.set_ylim(0, y_max)
+
+    # Add text annotations for each point
+    error_labels = []
+    for size, value in zip(sample_sizes, errors):
+        error_labels.append(ax2.annotate(f"{value:.3f}",
+                                         (size, value),
+                                         textcoords="offset points",
+                                         xytext=(0, 10),
+                                         ha='center'))
+
+    # Lay out at draw time so in-place updates are re-laid out too
+    fig.set_layout_engine('tight')
+
+    store_artists(fig, 'plot_law_of_large_numbers', {
+        'ax1': ax1,
+        'ax2': ax2,
+        'observed_line': observed_line,
+        'true_line': true_line,
+        'observed_labels': observed_labels,
+        'error_line': error_line,
+        'error_labels': error_labels
+    })
+
+    return fig
+
+
+def demonstrate_law_of_large_numbers(true_probability=0.05, seed=42, return_fig=False, fig=None, verbose=True):
     """
     Demonstrates the Law of Large Numbers using an insurance claims example
 
@@ -16,6 +279,10 @@ def demonstrate_law_of_large_numbers(true_probability=0.05, seed=42, return_fig=
         Random seed for reproducibility
     return_fig : bool
         If True, returns the figure and stats for Shiny integration
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to redraw into when return_fig is True
+    verbose : bool
+        If False, skips printing the insurance interpretation after the figure
 
     Returns:
     --------
@@ -24,209 +291,34 @@ def demonstrate_law_of_large_numbers(true_probability=0.05, seed=42, return_fig=
     stats : dict
         Key statistics (if return_fig is True)
     """
-    # Create sample sizes (increasing exponentially)
-    sample_sizes = [10, 50, 100, 500, 1000, 5000, 10000, 50000]
-
-    # Run experiment - simulate accidents for each sample size
-    results = []
-
-    # Set the seed using the provided value
-    np.random.seed(seed)
-
-    for size in sample_sizes:
-        # Generate random accidents (1 = accident, 0 = no accident)
-        accidents = np.random.random(size) < true_probability
-        observed_probability = np.mean(accidents)
-        results.append({
-            'sample_size': size,
-            'observed_probability': observed_probability,
-            'true_probability': true_probability,
-            'error': abs(observed_probability - true_probability)
-        })
+    stats = compute_law_of_large_numbers(true_probability, seed)
 
     # For Shiny integration, create a figure without displaying it
     if return_fig:
-        # Create the plot
-        fig = Figure(figsize=(14, 6))
-
-        # Create subplots
-        ax1 = fig.add_subplot(121)
-        ax2 = fig.add_subplot(122)
-
-        # DataFrame from results
-        df = pd.DataFrame(results)
-
-        # Plot 1: Observed probability vs sample size
-        ax1.semilogx(df['sample_size'], df['observed_probability'], 'bo-', linewidth=2, markersize=8)
-        ax1.axhline(true_probability, color='red', linestyle='--', label=f'True probability: {true_probability:.1%}')
-        ax1.set_xlabel('Number of Drivers')
-        ax1.set_ylabel('Observed Accident Rate')
-        ax1.set_title(f'Observed Accident Rate vs. Sample Size')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-
-        # Format x-tick labels to avoid scientific notation and use commas
-        from matplotlib.ticker import ScalarFormatter, FuncFormatter
-
-        def format_number(x, pos):
-            if x >= 1000:
-                return f'{x:,.0f}'  # Use commas for thousands
-            return f'{x:.0f}'
-
-        ax1.xaxis.set_major_formatter(FuncFormatter(format_number))
-
-        # Set fixed y-axis scale based on 90% confidence interval for the smallest sample (10 drivers)
-        # Using normal approximation to binomial with continuity correction
-        smallest_sample = sample_sizes[0]  # 10 drivers
-        p = true_probability
-        # Z-score for 90% confidence is 1.645
-        z_score = 1.645
-
-        # Calculate confidence interval bounds for the smallest sample
-        # Formula: p ± z * sqrt(p(1-p)/n)
-        ci_width = z_score * np.sqrt(p * (1 - p) / smallest_sample)
-        lower_bound = max(0, p - ci_width)
-        upper_bound = min(1, p + ci_width)
-
-        # Set y-axis with some padding to ensure all points are visible
-        padding = 0.05  # 5% padding
-        y_min = max(0, lower_bound - padding)
-        y_max = min(1, upper_bound + padding)
-
-        # Ensure the y-axis always includes the true probability
-        y_min = min(y_min, true_probability * 0.5)
-        y_max = max(y_max, true_probability * 1.5)
-
-        # Set y-axis limits
-        ax1.set_ylim(y_min, y_max)
-
-        # Format x-tick labels to avoid scientific notation
-        def format_number(x, pos):
-            if x >= 1000000:
-                return f'{x / 1000000:.0f}M'
-            return f'{x:.0f}'
-
-        # Add text annotations for each point
-        for i, row in df.iterrows():
-            ax1.annotate(f"{row['observed_probability']:.1%}",
-                         (row['sample_size'], row['observed_probability']),
-                         textcoords="offset points",
-                         xytext=(0, 10),
-                         ha='center')
-
-        # Plot 2: Error vs sample size - using semilogx (log scale for x, linear for y)
-        # This allows us to include 0 on the y-axis
-        ax2.semilogx(df['sample_size'], df['error'], 'ro-', linewidth=2, markersize=8)
-        ax2.set_xlabel('Number of Drivers')
-        ax2.set_ylabel('Error (|Observed - True|)')
-        ax2.set_title(f'Error vs. Sample Size')
-        ax2.grid(True, alpha=0.3)
-
-        # Format x-tick labels to avoid scientific notation and use commas
-        ax2.xaxis.set_major_formatter(FuncFormatter(format_number))
-
-        # Format y-tick labels to show more decimal places for small values
-        def format_error_value(y, pos):
-            if y < 0.001:
-                return f'{y:.4f}'
-            elif y < 0.01:
-                return f'{y:.3f}'
-            else:
-                return f'{y:.2f}'
-
-        ax2.yaxis.set_major_formatter(FuncFormatter(format_error_value))
-
-        # Set y-axis to start from 0
-        y_max = max(df['error']) * 1.2  # Add 20% to the max for clarity
-        ax2.set_ylim(0, y_max)
-
-        # Add text annotations for each point
-        for i, row in df.iterrows():
-            ax2.annotate(f"{row['error']:.3f}",
-                         (row['sample_size'], row['error']),
-                         textcoords="offset points",
-                         xytext=(0, 10),
-                         ha='center')
-
-        fig.tight_layout()
-
-        # Remove seed text from figure
-        # fig.text(0.5, 0.01, f"Simulation Seed: {seed}", ha='center',
-        #          fontsize=12, bbox=dict(facecolor='lightgray', alpha=0.5))
-
-        # Return the figure and key statistics
-        stats = {
-            'small_sample': results[0]['observed_probability'],
-            'medium_sample': results[5]['observed_probability'],
-            'large_sample': results[7]['observed_probability'],
-            'small_error': results[0]['error'],
-            'medium_error': results[5]['error'],
-            'large_error': results[7]['error'],
-            'seed': seed  # Include seed in stats
-        }
-
-        return fig, stats
+        return plot_law_of_large_numbers(stats, fig), stats
 
     # Original function for Jupyter notebook compatibility
-    else:
-        # Create figure
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-        # Plot 1: Observed probability vs sample size
-        df = pd.DataFrame(results)
-        ax1.semilogx(df['sample_size'], df['observed_probability'], 'bo-', linewidth=2, markersize=8)
-        ax1.axhline(true_probability, color='red', linestyle='--', label=f'True probability: {true_probability:.1%}')
-        ax1.set_xlabel('Number of Drivers')
-        ax1.set_ylabel('Observed Accident Rate')
-        ax1.set_title(f'Observed Accident Rate vs. Sample Size (Seed: {seed})')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-
-        # Format x-tick labels to avoid scientific notation
-        def format_number(x, pos):
-            if x >= 1000000:
-                return f'{x / 1000000:.0f}M'
-            return f'{x:.0f}'
-
-        from matplotlib.ticker import FuncFormatter
-        ax1.xaxis.set_major_formatter(FuncFormatter(format_number))
-
-        # Add text annotations for each point
-        for i, row in df.iterrows():
-            ax1.annotate(f"{row['observed_probability']:.1%}",
-                         (row['sample_size'], row['observed_probability']),
-                         textcoords="offset points",
-                         xytext=(0, 10),
-                         ha='center')
-
-        # Plot 2: Error vs sample size
-        ax2.loglog(df['sample_size'], df['error'], 'ro-', linewidth=2, markersize=8)
-        ax2.set_xlabel('Number of Drivers')
-        ax2.set_ylabel('Error (|Observed - True|)')
-        ax2.set_title(f'Error vs. Sample Size (Seed: {seed})')
-        ax2.grid(True, alpha=0.3)
-        ax2.xaxis.set_major_formatter(FuncFormatter(format_number))
-
-        # Add text annotations for each point
-        for i, row in df.iterrows():
-            ax2.annotate(f"{row['error']:.3f}",
-                         (row['sample_size'], row['error']),
-                         textcoords="offset points",
-                         xytext=(0, 10),
-                         ha='center')
-
-        # Add a text annotation with the seed value
-        fig.text(0.5, 0.01, f"Simulation Seed: {seed}", ha='center',
-                 fontsize=12, bbox=dict(facecolor='lightgray', alpha=0.5))
-
-        plt.tight_layout()
-        plt.show()
-
-        # Display insurance interpretation
-        print("\nInsurance Interpretation:")
-        print(f"• Simulation Seed: {seed}")
-        print(f"• With only 10 drivers, the observed accident rate was {results[0]['observed_probability']:.1%}, " +
-              f"which is {results[0]['error'] * 100:.1f} percentage points away from the true rate of {true_probability:.1%}")
-        print(f"• With 50,000 drivers, the observed accident rate was {results[7]['observed_probability']:.1%}, " +
-              f"which is {results[7]['error'] * 100:.1f} percentage points away from the true rate")
-        print("\nInsurance companies rely on large numbers of policyholders to make accurate predictions!")
\ No newline at end of file
+    import matplotlib.pyplot as plt  # Only the notebook path needs pyplot
+
+    # Same figure as the Shiny app, drawn into a pyplot figure so it can be shown
+    fig = plot_law_of_large_numbers(stats, plt.figure(figsize=(14, 6)))
+    for ax in fig.axes:
+        ax.set_title(f'{ax.get_title()} (Seed: {seed})')
+
+    # Add a text annotation with the seed value, keeping the tight layout clear of it
+    fig.text(0.5, 0.01, f"Simulation Seed: {seed}", ha='center',
+             fontsize=12, bbox=dict(facecolor='lightgray', alpha=0.5))
+    fig.get_layout_engine().set(rect=(0, 0.05, 1, 1))
+    plt.show()
+
+    if not verbose:
+        return
+
+    # Display insurance interpretation
+    print("\nInsurance Interpretation:")
+    print(f"• Simulation Seed: {seed}")
+    print(f"• With only 10 drivers, the observed accident rate was {stats['small_sample']:.1%}, " +
+          f"which is {stats['small_error'] * 100:.1f} percentage points away from the true rate of {true_probability:.1%}")
+    print(f"• With 50,000 drivers, the observed accident rate was {stats['large_sample']:.1%}, " +
+          f"which is {stats['large_error'] * 100:.1f} percentage points away from the true rate")
+    print("\nInsurance companies rely on large numbers of policyholders to make accurate predictions!")
\ No newline at end of file
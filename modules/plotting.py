@@ -0,0 +1,119 @@
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.layout_engine import LayoutEngine
+
+
+def prepare_figure(fig=None, figsize=None):
+    """
+    Returns an empty figure for a demonstration to draw into
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and reuse, keeping its canvas
+    figsize : tuple, optional
+        Size in inches of a newly created figure
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        An empty figure with an Agg canvas attached
+    """
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)  # Render with Agg directly, no canvas swap on save
+    else:
+        # Reuse the caller's figure and canvas, dropping the previous artists
+        fig.clear()
+    return fig
+
+
+class FixedMarginLayoutEngine(LayoutEngine):
+    """
+    Lays out a single column of subplots with fixed margins given in inches
+
+    A cheap stand-in for tight layout on figures whose labels keep the same
+    size whatever the data: the margins were measured once, so laying out at a
+    new size only converts them to figure fractions instead of measuring every
+    text artist.
+
+    Parameters:
+    -----------
+    left, right, top, bottom : float
+        Space in inches between the subplots and each edge of the figure
+    gap : float
+        Space in inches between vertically adjacent subplots
+    """
+    _adjust_compatible = True
+    _colorbar_gridspec = True
+
+    def __init__(self, left, right, top, bottom, gap):
+        super().__init__()
+        self.left, self.right, self.top, self.bottom, self.gap = left, right, top, bottom, gap
+
+    def execute(self, fig):
+        width, height = fig.get_size_inches()
+        nrows = fig.axes[0].get_subplotspec().get_gridspec().nrows
+        axes_height = (height - self.top - self.bottom - (nrows - 1) * self.gap) / nrows
+        fig.subplots_adjust(left=self.left / width, right=1 - self.right / width,
+                            bottom=self.bottom / height, top=1 - self.top / height,
+                            hspace=self.gap / axes_height)
+
+
+def stored_artists(fig, owner):
+    """
+    Returns the artists saved for a figure by store_artists
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure or None
+        Figure passed in for redrawing
+    owner : str
+        Name of the plot function looking up its artists
+
+    Returns:
+    --------
+    artists : dict or None
+        The saved artists, or None if fig is None, was drawn by another owner or
+        has been cleared since
+    """
+    saved = getattr(fig, '_stored_artists', None)
+    if saved is None or saved[0] != owner or saved[1]['ax1'] not in fig.axes:
+        return None
+    return saved[1]
+
+
+def store_artists(fig, owner, artists):
+    """
+    Saves the artists a plot function drew, so a later call can update them in place
+
+    They are kept on the figure itself rather than in a module-level mapping: the
+    artists refer back to the figure, so a mapping keyed on it (even a
+    WeakKeyDictionary) would keep every figure alive. This way they are freed
+    with the figure.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure the artists were drawn on
+    owner : str
+        Name of the plot function that drew them
+    artists : dict
+        The artists, including the first axes under 'ax1'
+    """
+    fig._stored_artists = (owner, artists)
+
+
+def release_artists(fig):
+    """
+    Forgets the artists saved for a figure ahead of the figure itself being freed
+
+    Optional, since the artists go with the figure anyway; it breaks the
+    figure's references to its artists early, e.g. once a session has ended.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure that will not be updated in place again
+    """
+    vars(fig).pop('_stored_artists', None)
@@ -1,10 +1,199 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-from matplotlib.figure import Figure
+from functools import lru_cache
+from .plotting import prepare_figure, store_artists, stored_artists
 
+EXPENSE_RATIO = 0.25  # Fixed at 25% of premium
+RISK_MARGIN_RATIO = 0.05  # Fixed at 5% of premium
 
-def demonstrate_premium_calculation(accident_frequency=0.05, claim_severity=8000, return_fig=False):
+# Premium components (solving the equation)
+# Premium = Expected Loss + Expense Ratio × Premium + Risk Margin × Premium
+# Premium = Expected Loss / (1 - Expense Ratio - Risk Margin)
+PREMIUM_DIVISOR = 1 - EXPENSE_RATIO - RISK_MARGIN_RATIO
+
+COMPONENTS = ('Expected Loss', 'Expenses', 'Risk Margin')
+COMPONENT_COLORS = ('blue', 'orange', 'green')
+
+
+# Large enough for every slider setting (20 frequencies x 19 severities)
+@lru_cache(maxsize=512)
+def compute_premium_calculation(accident_frequency=0.05, claim_severity=8000):
+    """
+    Calculates the premium components for a given frequency and severity
+
+    Results are cached on (accident_frequency, claim_severity), so repeated calls
+    with the same slider values skip the calculation. The returned dict is shared
+    between callers and must not be modified.
+
+    Parameters:
+    -----------
+    accident_frequency : float
+        The probability of an accident
+    claim_severity : float
+        The average cost of a claim
+
+    Returns:
+    --------
+    stats : dict
+        Key statistics, plus the inputs and ratios used for plotting
+    """
+    # Calculate components
+    expected_loss = accident_frequency * claim_severity
+    premium = expected_loss / PREMIUM_DIVISOR
+    expenses = premium * EXPENSE_RATIO
+    risk_margin = premium * RISK_MARGIN_RATIO
+
+    # Loading factor
+    loading_factor = premium / expected_loss
+
+    return {
+        'expected_loss': expected_loss,
+        'expenses': expenses,
+        'risk_margin': risk_margin,
+        'premium': premium,
+        'loading_factor': loading_factor,
+        'accident_frequency': accident_frequency,
+        'claim_severity': claim_severity,
+        'expense_ratio': EXPENSE_RATIO,
+        'risk_margin_ratio': RISK_MARGIN_RATIO
+    }
+
+
+def _component_values(stats):
+    """Returns the premium components in the order of COMPONENTS"""
+    return [stats['expected_loss'], stats['expenses'], stats['risk_margin']]
+
+
+def _component_label(value, premium):
+    """Returns the text shown inside a premium component bar"""
+    return f'${value:.2f}\n({value / premium * 100:.1f}%)'
+
+
+def _draw_premium_pie(ax, stats):
+    """Draws the premium breakdown pie chart of the premium calculation figure"""
+    ax.pie(_component_values(stats), labels=COMPONENTS, colors=COMPONENT_COLORS, autopct='%1.1f%%',
+           startangle=90, textprops={'fontsize': 12})
+    ax.set_title(f'Premium Breakdown (Total: ${stats["premium"]:.2f})', fontsize=14)
+
+
+def _formula_text(stats):
+    """Returns the worked premium formula shown beside the plots"""
+    expected_loss = stats['expected_loss']
+    return f"Premium Calculation:\n\n" \
+           f"• Expected Loss = Frequency × Severity\n" \
+           f"  = {stats['accident_frequency']:.1%} × ${stats['claim_severity']:,.0f}\n" \
+           f"  = ${expected_loss:.2f}\n\n" \
+           f"• Premium = Expected Loss / (1 - Expense% - Risk%)\n" \
+           f"  = ${expected_loss:.2f} / (1 - {stats['expense_ratio']:.0%} - {stats['risk_margin_ratio']:.0%})\n" \
+           f"  = ${stats['premium']:.2f}"
+
+
+def _update_premium_calculation(artists, stats):
+    """Moves the artists of an existing premium calculation figure to new statistics"""
+    premium = stats['premium']
+    values = _component_values(stats)
+
+    # Plot 1: bar heights, their labels and the total premium line
+    for bar, text, value in zip(artists['bars'], artists['bar_labels'], values):
+        bar.set_height(value)
+        text.set_y(value / 2)
+        text.set_text(_component_label(value, premium))
+        text.set_color('white' if value > 100 else 'black')
+    label = f'Total Premium: ${premium:.2f}'
+    artists['premium_line'].set_ydata([premium, premium])
+    artists['premium_line'].set_label(label)
+    artists['ax1'].get_legend().get_texts()[0].set_text(label)
+    artists['ax1'].relim()
+    # relim reads the premium line back through its blended transform, which can
+    # round it down an ulp and change the ticks; include the exact value as well
+    artists['ax1'].update_datalim([(0, premium)])
+    artists['ax1'].autoscale_view()
+
+    # Plot 2: the three-wedge pie is cheap to redraw, and its label placement is
+    # computed by pie() itself
+    artists['ax2'].clear()
+    _draw_premium_pie(artists['ax2'], stats)
+
+    artists['formula_text'].set_text(_formula_text(stats))
+
+
+def plot_premium_calculation(stats, fig=None):
+    """
+    Builds the premium calculation figure from precomputed statistics
+
+    When fig was previously drawn by this function, its bars, labels, pie and
+    formula are updated in place instead of rebuilding the figure.
+
+    Parameters:
+    -----------
+    stats : dict
+        Statistics returned by compute_premium_calculation
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to update or redraw into instead of creating a new one
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object
+    """
+    artists = stored_artists(fig, 'plot_premium_calculation')
+    if artists is not None:
+        _update_premium_calculation(artists, stats)
+        return fig
+
+    premium = stats['premium']
+
+    # Create figure
+    fig = prepare_figure(fig, figsize=(12, 10))
+
+    # Create subplots
+    ax1 = fig.add_subplot(211)
+    ax2 = fig.add_subplot(212)
+
+    # Plot 1: Premium components
+    values = _component_values(stats)
+
+    bars = ax1.bar(COMPONENTS, values, color=COMPONENT_COLORS, alpha=0.7)
+    ax1.set_title('Premium Components', fontsize=14)
+    ax1.set_ylabel('Amount ($)', fontsize=12)
+    ax1.grid(axis='y', alpha=0.3)
+
+    # Add a line for total premium
+    premium_line = ax1.axhline(premium, color='red', linestyle='--', label=f'Total Premium: ${premium:.2f}')
+    ax1.legend(fontsize=12)
+
+    # Add text annotations for each component
+    bar_labels = []
+    for bar, value in zip(bars, values):
+        bar_labels.append(ax1.text(bar.get_x() + bar.get_width() / 2, value / 2,
+                                   _component_label(value, premium),
+                                   ha='center', va='center',
+                                   color='white' if value > 100 else 'black',
+                                   fontsize=11))
+
+    # Plot 2: Breakdown in pie chart
+    _draw_premium_pie(ax2, stats)
+
+    # Add the formula text as an annotation instead of a separate axis
+    formula_text = fig.text(0.75, 0.3, _formula_text(stats), fontsize=12,
+                            verticalalignment='center', horizontalalignment='left',
+                            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.7))
+
+    # Adjust spacing
+    fig.subplots_adjust(hspace=0.4)
+
+    store_artists(fig, 'plot_premium_calculation', {
+        'ax1': ax1,
+        'ax2': ax2,
+        'bars': bars,
+        'bar_labels': bar_labels,
+        'premium_line': premium_line,
+        'formula_text': formula_text,
+    })
+
+    return fig
+
+
+def demonstrate_premium_calculation(accident_frequency=0.05, claim_severity=8000, return_fig=False, fig=None):
     """
     Demonstrates how insurance premiums are calculated
 
@@ -16,6 +205,8 @@ def demonstrate_premium_calculation(accident_frequency=0.05, claim_severity=8000
         The average cost of a claim
     return_fig : bool
         If True, returns the figure and stats for Shiny integration
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to redraw into when return_fig is True
 
     Returns:
     --------
@@ -24,147 +215,31 @@ def demonstrate_premium_calculation(accident_frequency=0.05, claim_severity=8000
     stats : dict
         Key statistics (if return_fig is True)
     """
-    # Calculate components
-    expected_loss = accident_frequency * claim_severity
-    expense_ratio = 0.25  # Fixed at 25% of premium
-    risk_margin_ratio = 0.05  # Fixed at 5% of premium
-
-    # Premium components (solving the equation)
-    # Premium = Expected Loss + Expense Ratio × Premium + Risk Margin × Premium
-    # Premium = Expected Loss / (1 - Expense Ratio - Risk Margin)
-    premium = expected_loss / (1 - expense_ratio - risk_margin_ratio)
-    expenses = premium * expense_ratio
-    risk_margin = premium * risk_margin_ratio
-
-    # Loading factor
-    loading_factor = premium / expected_loss
+    stats = compute_premium_calculation(accident_frequency, claim_severity)
 
     # For Shiny integration
     if return_fig:
-        # Create figure
-        fig = Figure(figsize=(12, 10))
-
-        # Create subplots
-        ax1 = fig.add_subplot(211)
-        ax2 = fig.add_subplot(212)
-
-        # Plot 1: Premium components
-        components = ['Expected Loss', 'Expenses', 'Risk Margin']
-        values = [expected_loss, expenses, risk_margin]
-        colors = ['blue', 'orange', 'green']
-
-        bars = ax1.bar(components, values, color=colors, alpha=0.7)
-        ax1.set_title('Premium Components', fontsize=14)
-        ax1.set_ylabel('Amount ($)', fontsize=12)
-        ax1.grid(axis='y', alpha=0.3)
-
-        # Add a line for total premium
-        ax1.axhline(premium, color='red', linestyle='--', label=f'Total Premium: ${premium:.2f}')
-        ax1.legend(fontsize=12)
-
-        # Add text annotations for each component
-        for bar, value, component in zip(bars, values, components):
-            percentage = value / premium * 100
-            ax1.text(bar.get_x() + bar.get_width() / 2, value / 2,
-                     f'${value:.2f}\n({percentage:.1f}%)',
-                     ha='center', va='center',
-                     color='white' if value > 100 else 'black',
-                     fontsize=11)
-
-        # Plot 2: Breakdown in pie chart
-        ax2.pie(values, labels=components, colors=colors, autopct='%1.1f%%', startangle=90,
-                textprops={'fontsize': 12})
-        ax2.set_title(f'Premium Breakdown (Total: ${premium:.2f})', fontsize=14)
-
-        # Create formula text at the side
-        formula_text = f"Premium Calculation:\n\n" \
-                       f"• Expected Loss = Frequency × Severity\n" \
-                       f"  = {accident_frequency:.1%} × ${claim_severity:,.0f}\n" \
-                       f"  = ${expected_loss:.2f}\n\n" \
-                       f"• Premium = Expected Loss / (1 - Expense% - Risk%)\n" \
-                       f"  = ${expected_loss:.2f} / (1 - {expense_ratio:.0%} - {risk_margin_ratio:.0%})\n" \
-                       f"  = ${premium:.2f}"
-
-        # Add the text as an annotation instead of a separate axis
-        fig.text(0.75, 0.3, formula_text, fontsize=12,
-                 verticalalignment='center', horizontalalignment='left',
-                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.7))
-
-        # Adjust spacing
-        fig.subplots_adjust(hspace=0.4)
-
-        # Key statistics to return
-        stats = {
-            'expected_loss': expected_loss,
-            'expenses': expenses,
-            'risk_margin': risk_margin,
-            'premium': premium,
-            'loading_factor': loading_factor
-        }
-
-        return fig, stats
+        return plot_premium_calculation(stats, fig), stats
 
     # Original function for compatibility
-    else:
-        # Create figure
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-
-        # Plot 1: Premium components
-        components = ['Expected Loss', 'Expenses', 'Risk Margin']
-        values = [expected_loss, expenses, risk_margin]
-        colors = ['blue', 'orange', 'green']
-
-        bars = ax1.bar(components, values, color=colors, alpha=0.7)
-        ax1.set_title('Premium Components', fontsize=14)
-        ax1.set_ylabel('Amount ($)', fontsize=12)
-        ax1.grid(axis='y', alpha=0.3)
-
-        # Add a line for total premium
-        ax1.axhline(premium, color='red', linestyle='--', label=f'Total Premium: ${premium:.2f}')
-        ax1.legend(fontsize=12)
-
-        # Add text annotations for each component
-        for bar, value, component in zip(bars, values, components):
-            percentage = value / premium * 100
-            ax1.text(bar.get_x() + bar.get_width() / 2, value / 2,
-                     f'${value:.2f}\n({percentage:.1f}%)',
-                     ha='center', va='center',
-                     color='white' if value > 100 else 'black',
-                     fontsize=11)
-
-        # Plot 2: Breakdown in pie chart
-        ax2.pie(values, labels=components, colors=colors, autopct='%1.1f%%', startangle=90,
-                textprops={'fontsize': 12})
-        ax2.set_title(f'Premium Breakdown (Total: ${premium:.2f})', fontsize=14)
-
-        # Create a separate axis for the formula text
-        formula_ax = plt.axes([0.80, 0.15, 0.25, 0.25])
-        formula_ax.axis('off')  # Hide axis
-
-        # Formula text content
-        formula_text = f"Premium Calculation:\n\n" \
-                       f"• Expected Loss = Frequency × Severity\n" \
-                       f"  = {accident_frequency:.1%} × ${claim_severity:,.0f}\n" \
-                       f"  = ${expected_loss:.2f}\n\n" \
-                       f"• Premium = Expected Loss / (1 - Expense% - Risk%)\n" \
-                       f"  = ${expected_loss:.2f} / (1 - {expense_ratio:.0%} - {risk_margin_ratio:.0%})\n" \
-                       f"  = ${premium:.2f}"
-
-        # Add the formula text to the axis
-        formula_ax.text(0, 0.5, formula_text, fontsize=12,
-                        verticalalignment='center', horizontalalignment='left',
-                        bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.7))
-
-        # Adjust spacing
-        plt.subplots_adjust(hspace=0.4)
-        plt.show()
-
-        # Display insurance interpretation
-        print("\nInsurance Interpretation:")
-        print(f"• Accident Frequency: {accident_frequency:.1%} (probability of claim per year)")
-        print(f"• Average Claim Severity: ${claim_severity:,.0f} (average cost when a claim occurs)")
-        print(f"• Expected Loss: ${expected_loss:.2f} (pure cost of risk)")
-        print(f"• Expenses: ${expenses:.2f} ({expense_ratio:.0%} of premium for administration, commissions, etc.)")
-        print(f"• Risk Margin: ${risk_margin:.2f} ({risk_margin_ratio:.0%} of premium for profit and uncertainty)")
-        print(f"• Final Premium: ${premium:.2f}")
-        print("\nThis is the base premium before applying individual rating factors like age, driving history, etc.")
\ No newline at end of file
+    import matplotlib.pyplot as plt  # Only the notebook path needs pyplot
+    expected_loss = stats['expected_loss']
+    expenses = stats['expenses']
+    risk_margin = stats['risk_margin']
+    premium = stats['premium']
+    expense_ratio = stats['expense_ratio']
+    risk_margin_ratio = stats['risk_margin_ratio']
+
+    # Same figure as the Shiny app, drawn into a pyplot figure so it can be shown
+    plot_premium_calculation(stats, plt.figure(figsize=(12, 10)))
+    plt.show()
+
+    # Display insurance interpretation
+    print("\nInsurance Interpretation:")
+    print(f"• Accident Frequency: {accident_frequency:.1%} (probability of claim per year)")
+    print(f"• Average Claim Severity: ${claim_severity:,.0f} (average cost when a claim occurs)")
+    print(f"• Expected Loss: ${expected_loss:.2f} (pure cost of risk)")
+    print(f"• Expenses: ${expenses:.2f} ({expense_ratio:.0%} of premium for administration, commissions, etc.)")
+    print(f"• Risk Margin: ${risk_margin:.2f} ({risk_margin_ratio:.0%} of premium for profit and uncertainty)")
+    print(f"• Final Premium: ${premium:.2f}")
+    print("\nThis is the base premium before applying individual rating factors like age, driving history, etc.")
\ No newline at end of file
@@ -1,12 +1,19 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-from matplotlib.figure import Figure
+from functools import lru_cache
+from .plotting import prepare_figure, store_artists, stored_artists
 
+# Fixed claim amount at $20,000
+CLAIM_AMOUNT = 20000
 
-def demonstrate_risk_pooling(accident_probability=0.05, num_policyholders=100, seed=42, return_fig=False):
+
+@lru_cache(maxsize=256)
+def compute_risk_pooling(accident_probability=0.05, num_policyholders=100, seed=42):
     """
-    Demonstrates the concept of risk pooling in insurance
+    Runs the policyholder simulation behind the risk pooling demonstration
+
+    Results are cached on (accident_probability, num_policyholders, seed), so
+    repeated calls with the same slider values skip the simulation. The returned
+    dict is shared between callers and must not be modified.
 
     Parameters:
     -----------
@@ -16,285 +23,423 @@ def demonstrate_risk_pooling(accident_probability=0.05, num_policyholders=100, s
         The number of policyholders
     seed : int
         Random seed for reproducibility
-    return_fig : bool
-        If True, returns the figure and stats for Shiny integration
 
     Returns:
     --------
-    fig : matplotlib.figure.Figure
-        The figure object (if return_fig is True)
     stats : dict
-        Key statistics (if return_fig is True)
+        Key statistics, plus the individual outcomes used for plotting (costs
+        only for the displayed policyholders)
     """
-    # Fixed claim amount at $20,000
-    CLAIM_AMOUNT = 20000
-
-    # Set random seed for consistent results
-    np.random.seed(seed)
+    # Use a seeded generator for consistent results
+    rng = np.random.default_rng(seed)
 
     # Run the simulation - generate random accidents
-    accidents = np.random.random(num_policyholders) < accident_probability
+    accidents = rng.random(num_policyholders) < accident_probability
+
+    # Calculate stats - every claim is the same size, so totals follow from the claim count
+    num_with_loss = int(np.count_nonzero(accidents))
+    percent_with_loss = num_with_loss / num_policyholders * 100
 
     # Calculate results
-    individual_costs = np.where(accidents, CLAIM_AMOUNT, 0)
-    total_losses = np.sum(individual_costs)
+    total_losses = num_with_loss * CLAIM_AMOUNT
     fair_premium = accident_probability * CLAIM_AMOUNT
     pool_premium_total = fair_premium * num_policyholders
-
-    # Calculate stats
-    num_with_loss = np.sum(accidents)
-    percent_with_loss = np.mean(accidents) * 100
     pool_performance = total_losses / pool_premium_total
 
+    # Individual outcomes are only plotted for the first policyholders
+    display_n = min(50, num_policyholders)
+    individual_costs = np.where(accidents[:display_n], CLAIM_AMOUNT, 0)
+
+    # Jitter for the individual outcomes scatter, drawn here so the plot is reproducible
+    x_jitter = rng.uniform(-0.2, 0.2, size=display_n)
+
+    # Read-only, since the cached arrays are handed to every caller
+    accidents.flags.writeable = False
+    individual_costs.flags.writeable = False
+    x_jitter.flags.writeable = False
+
+    return {
+        'num_with_loss': num_with_loss,
+        'percent_with_loss': percent_with_loss,
+        'fair_premium': fair_premium,
+        'total_losses': total_losses,
+        'pool_premium_total': pool_premium_total,
+        'pool_performance': pool_performance,
+        'accident_probability': accident_probability,
+        'num_policyholders': num_policyholders,
+        'accidents': accidents,
+        'individual_costs': individual_costs,
+        'x_jitter': x_jitter,
+        'seed': seed  # Include seed in stats
+    }
+
+
+def _pool_summary(stats):
+    """Returns the insurer-perspective y-limit and text for the risk pooling figure"""
+    pool_premium_total = stats['pool_premium_total']
+    total_losses = stats['total_losses']
+    pool_performance = stats['pool_performance']
+
+    # Calculate expected maximum loss at 99% confidence level based on binomial distribution
+    # This helps keep the y-axis consistent across different simulations
+    p = stats['accident_probability']
+    n = stats['num_policyholders']
+    # Using normal approximation to binomial with continuity correction for 99% CI (2.576 is z-score for 99%)
+    max_expected_claims = n * p + 2.576 * np.sqrt(n * p * (1 - p)) + 0.5
+    max_expected_loss = max_expected_claims * CLAIM_AMOUNT
+
+    # Set y-axis to use the consistent 99% CI maximum
+    y_max = max(max_expected_loss, total_losses) * 1.1  # Add 10% margin
+
+    performance_text = "Surplus" if pool_performance < 1 else "Deficit"
+    summary_text = f"Expected losses: ${pool_premium_total:,.0f}\nActual losses: ${total_losses:,.0f}\n" \
+                   f"{performance_text}: ${abs(pool_premium_total - total_losses):,.0f}"
+    return y_max, summary_text
+
+
+def _update_risk_pooling(artists, stats):
+    """Moves the artists of an existing risk pooling figure to new statistics"""
+    num_policyholders = stats['num_policyholders']
+    num_with_loss = stats['num_with_loss']
+    fair_premium = stats['fair_premium']
+    total_losses = stats['total_losses']
+    pool_premium_total = stats['pool_premium_total']
+    pool_performance = stats['pool_performance']
+    display_n = min(50, num_policyholders)
+
+    # Plot 1: Individual outcomes
+    artists['outcomes'].set_offsets(np.column_stack((stats['x_jitter'], stats['individual_costs'][:display_n])))
+    artists['outcomes_legend'].set_text(f'Individual outcomes (n={display_n})')
+    artists['premium_bar'].set_height(fair_premium)
+    artists['loss_note'].set_text(
+        f"{num_with_loss} out of {num_policyholders} people\nexperienced a ${CLAIM_AMOUNT:,} loss")
+    artists['premium_note'].set_text(f"Everyone pays\n${fair_premium:,.0f}")
+    artists['premium_note'].xy = (1, fair_premium / 2)
+    artists['premium_note'].set_position((1, fair_premium * 1.5))
+
+    # Plot 2: Pooled outcome
+    y_max, summary_text = _pool_summary(stats)
+    artists['premium_total_bar'].set_height(pool_premium_total)
+    artists['losses_bar'].set_height(total_losses)
+    artists['ax2'].set_ylim(0, y_max)
+    artists['summary'].set_text(summary_text)
+    artists['ratio'].set_position((1, total_losses + 0.05 * max(pool_premium_total, total_losses)))
+    artists['ratio'].set_text(f"Actual/Expected: {pool_performance:.2f}")
+    artists['ratio'].set_color("green" if pool_performance < 1 else "red")
+
+
+def plot_risk_pooling(stats, fig=None):
+    """
+    Builds the risk pooling figure from precomputed statistics
+
+    When fig was previously drawn by this function, its points, bars and labels
+    are updated in place instead of rebuilding the figure.
+
+    Parameters:
+    -----------
+    stats : dict
+        Statistics returned by compute_risk_pooling
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to update or redraw into instead of creating a new one
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object
+    """
+    artists = stored_artists(fig, 'plot_risk_pooling')
+    if artists is not None:
+        _update_risk_pooling(artists, stats)
+        return fig
+
+    num_policyholders = stats['num_policyholders']
+    individual_costs = stats['individual_costs']
+    num_with_loss = stats['num_with_loss']
+    fair_premium = stats['fair_premium']
+    total_losses = stats['total_losses']
+    pool_premium_total = stats['pool_premium_total']
+    pool_performance = stats['pool_performance']
+    x_jitter = stats['x_jitter']
+
+    # Create figure
+    fig = prepare_figure(fig, figsize=(14, 7))
+
+    # Create subplots
+    ax1 = fig.add_subplot(121)
+    ax2 = fig.add_subplot(122)
+
+    # Plot 1: Individual outcomes with improved visualization
+    display_n = min(50, num_policyholders)
+
+    # Blue bar chart for individual outcomes
+    ax1.bar(
+        ['Without Insurance'],
+        [CLAIM_AMOUNT],
+        color='lightblue',
+        alpha=0.3,
+        width=0.6,
+        label='Potential loss amount'
+    )
+
+    # Overlay scatter plot showing actual outcomes
+    x_positions = np.ones(display_n) * 0  # All points at x=0 ("Without Insurance")
+    y_positions = individual_costs[:display_n]  # Each person's actual outcome
+
+    # Add jitter to x positions for better visualization
+    x_positions += x_jitter
+
+    # Plot the actual outcomes as scatter points
+    outcomes = ax1.scatter(
+        x_positions,
+        y_positions,
+        color='blue',
+        alpha=0.7,
+        label=f'Individual outcomes (n={display_n})'
+    )
+
+    # Add a bar for premium with insurance
+    premium_bars = ax1.bar(
+        ['With Insurance'],
+        [fair_premium],
+        color='green',
+        alpha=0.7,
+        width=0.6,
+        label='Insurance premium'
+    )
+
+    # Annotation showing how many people experienced a loss
+    loss_note = ax1.annotate(
+        f"{num_with_loss} out of {num_policyholders} people\nexperienced a ${CLAIM_AMOUNT:,} loss",
+        xy=(0, CLAIM_AMOUNT / 2),
+        xytext=(0, CLAIM_AMOUNT * 0.7),
+        ha='center',
+        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8)
+    )
+
+    # Annotation explaining insurance premium
+    premium_note = ax1.annotate(
+        f"Everyone pays\n${fair_premium:,.0f}",
+        xy=(1, fair_premium / 2),
+        xytext=(1, fair_premium * 1.5),
+        ha='center',
+        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.8)
+    )
+
+    ax1.set_ylabel('Cost ($)')
+    ax1.set_title(f'Individual Risk Outcomes vs Pooled Outcomes')
+    ax1.grid(axis='y', alpha=0.3)
+    legend = ax1.legend(loc='upper center')
+
+    # Set y-axis limit to ensure visibility of premium
+    ax1.set_ylim(0, CLAIM_AMOUNT * 1.1)
+
+    # Plot 2: Pooled outcome (insurer perspective)
+    pool_bars = ax2.bar(['Premiums Collected', 'Actual Losses'],
+                        [pool_premium_total, total_losses],
+                        color=['green', 'blue'], alpha=0.7)
+    ax2.set_ylabel('Amount ($)')
+    ax2.set_title(f'Insurer\'s Perspective')
+
+    y_max, summary_text = _pool_summary(stats)
+    ax2.set_ylim(0, y_max)
+
+    ax2.grid(True, alpha=0.3)
+
+    # Add explanatory text
+    performance_color = "green" if pool_performance < 1 else "red"
+
+    summary = ax2.text(0.5, 0.95, summary_text,
+                       transform=ax2.transAxes, ha='center', va='top',
+                       bbox=dict(boxstyle="round,pad=0.5", facecolor="wheat", alpha=0.8))
+
+    # Add annotation for ratio
+    ratio = ax2.text(1, total_losses + 0.05 * max(pool_premium_total, total_losses),
+                     f"Actual/Expected: {pool_performance:.2f}", ha='center', color=performance_color)
+
+    # Remove seed text from figure
+    # fig.text(0.5, 0.01, f"Simulation Seed: {seed}", ha='center',
+    #          fontsize=12, bbox=dict(facecolor='lightgray', alpha=0.5))
+
+    # Lay out at draw time so in-place updates are re-laid out too
+    fig.set_layout_engine('tight')
+
+    store_artists(fig, 'plot_risk_pooling', {
+        'ax1': ax1,
+        'ax2': ax2,
+        'outcomes': outcomes,
+        'outcomes_legend': next(t for t in legend.get_texts() if t.get_text() == outcomes.get_label()),
+        'premium_bar': premium_bars.patches[0],
+        'loss_note': loss_note,
+        'premium_note': premium_note,
+        'premium_total_bar': pool_bars.patches[0],
+        'losses_bar': pool_bars.patches[1],
+        'summary': summary,
+        'ratio': ratio,
+    })
+
+    return fig
+
+
+def demonstrate_risk_pooling(accident_probability=0.05, num_policyholders=100, seed=42, return_fig=False, fig=None):
+    """
+    Demonstrates the concept of risk pooling in insurance
+
+    Parameters:
+    -----------
+    accident_probability : float
+        The probability of an accident
+    num_policyholders : int
+        The number of policyholders
+    seed : int
+        Random seed for reproducibility
+    return_fig : bool
+        If True, returns the figure and stats for Shiny integration
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to redraw into when return_fig is True
+
+    Returns:
+    --------
+    fig : matplotlib.figure.Figure
+        The figure object (if return_fig is True)
+    stats : dict
+        Key statistics (if return_fig is True)
+    """
+    stats = compute_risk_pooling(accident_probability, num_policyholders, seed)
+
     # For Shiny integration
     if return_fig:
-        # Create figure
-        fig = Figure(figsize=(14, 7))
-
-        # Create subplots
-        ax1 = fig.add_subplot(121)
-        ax2 = fig.add_subplot(122)
-
-        # Plot 1: Individual outcomes with improved visualization
-        display_n = min(50, num_policyholders)
-
-        # Blue bar chart for individual outcomes
-        ax1.bar(
-            ['Without Insurance'],
-            [CLAIM_AMOUNT],
-            color='lightblue',
-            alpha=0.3,
-            width=0.6,
-            label='Potential loss amount'
-        )
-
-        # Overlay scatter plot showing actual outcomes
-        x_positions = np.ones(display_n) * 0  # All points at x=0 ("Without Insurance")
-        y_positions = individual_costs[:display_n]  # Each person's actual outcome
-
-        # Add jitter to x positions for better visualization
-        x_jitter = np.random.uniform(-0.2, 0.2, size=display_n)
-        x_positions += x_jitter
-
-        # Plot the actual outcomes as scatter points
-        ax1.scatter(
-            x_positions,
-            y_positions,
-            color='blue',
-            alpha=0.7,
-            label=f'Individual outcomes (n={display_n})'
-        )
-
-        # Add a bar for premium with insurance
-        ax1.bar(
-            ['With Insurance'],
-            [fair_premium],
-            color='green',
-            alpha=0.7,
-            width=0.6,
-            label='Insurance premium'
-        )
-
-        # Annotation showing how many people experienced a loss
-        ax1.annotate(
-            f"{num_with_loss} out of {num_policyholders} people\nexperienced a ${CLAIM_AMOUNT:,} loss",
-            xy=(0, CLAIM_AMOUNT / 2),
-            xytext=(0, CLAIM_AMOUNT * 0.7),
-            ha='center',
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8)
-        )
-
-        # Annotation explaining insurance premium
-        ax1.annotate(
-            f"Everyone pays\n${fair_premium:,.0f}",
-            xy=(1, fair_premium / 2),
-            xytext=(1, fair_premium * 1.5),
-            ha='center',
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.8)
-        )
-
-        ax1.set_ylabel('Cost ($)')
-        ax1.set_title(f'Individual Risk Outcomes vs Pooled Outcomes')
-        ax1.grid(axis='y', alpha=0.3)
-        ax1.legend(loc='upper center')
-
-        # Set y-axis limit to ensure visibility of premium
-        ax1.set_ylim(0, CLAIM_AMOUNT * 1.1)
-
-        # Plot 2: Pooled outcome (insurer perspective)
-        ax2.bar(['Premiums Collected', 'Actual Losses'],
-                [pool_premium_total, total_losses],
-                color=['green', 'blue'], alpha=0.7)
-        ax2.set_ylabel('Amount ($)')
-        ax2.set_title(f'Insurer\'s Perspective')
-
-        # Calculate expected maximum loss at 99% confidence level based on binomial distribution
-        # This helps keep the y-axis consistent across different simulations
-        p = accident_probability
-        n = num_policyholders
-        # Using normal approximation to binomial with continuity correction for 99% CI (2.576 is z-score for 99%)
-        max_expected_claims = n * p + 2.576 * np.sqrt(n * p * (1 - p)) + 0.5
-        max_expected_loss = max_expected_claims * CLAIM_AMOUNT
-
-        # Set y-axis to use the consistent 99% CI maximum
-        y_max = max(max_expected_loss, total_losses) * 1.1  # Add 10% margin
-        ax2.set_ylim(0, y_max)
-
-        ax2.grid(True, alpha=0.3)
-
-        # Add explanatory text
-        performance_text = "Surplus" if pool_performance < 1 else "Deficit"
-        performance_color = "green" if pool_performance < 1 else "red"
-
-        ax2.text(0.5, 0.95,
-                 f"Expected losses: ${pool_premium_total:,.0f}\nActual losses: ${total_losses:,.0f}\n{performance_text}: ${abs(pool_premium_total - total_losses):,.0f}",
-                 transform=ax2.transAxes, ha='center', va='top',
-                 bbox=dict(boxstyle="round,pad=0.5", facecolor="wheat", alpha=0.8))
-
-        # Add annotation for ratio
-        ax2.text(1, total_losses + 0.05 * max(pool_premium_total, total_losses),
-                 f"Actual/Expected: {pool_performance:.2f}", ha='center', color=performance_color)
-
-        # Remove seed text from figure
-        # fig.text(0.5, 0.01, f"Simulation Seed: {seed}", ha='center',
-        #          fontsize=12, bbox=dict(facecolor='lightgray', alpha=0.5))
-
-        fig.tight_layout()
-
-        # Return the figure and key statistics
-        stats = {
-            'num_with_loss': num_with_loss,
-            'percent_with_loss': percent_with_loss,
-            'fair_premium': fair_premium,
-            'total_losses': total_losses,
-            'pool_premium_total': pool_premium_total,
-            'pool_performance': pool_performance,
-            'seed': seed  # Include seed in stats
-        }
-
-        return fig, stats
+        return plot_risk_pooling(stats, fig), stats
 
     # Original function for compatibility
-    else:
-        # Create figure
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
-
-        # Plot 1: Individual outcomes with improved visualization
-        display_n = min(50, num_policyholders)
-
-        # Create a categorical plot to better show binary outcomes
-        categories = ['No Loss', 'Loss']
-        counts = [display_n - np.sum(accidents[:display_n]), np.sum(accidents[:display_n])]
-
-        # Blue bar chart for individual outcomes
-        ax1.bar(
-            ['Without Insurance'],
-            [CLAIM_AMOUNT],
-            color='lightblue',
-            alpha=0.3,
-            width=0.6,
-            label='Potential loss amount'
-        )
-
-        # Overlay scatter plot showing actual outcomes
-        x_positions = np.ones(display_n) * 0  # All points at x=0 ("Without Insurance")
-        y_positions = individual_costs[:display_n]  # Each person's actual outcome
-
-        # Add jitter to x positions for better visualization
-        x_jitter = np.random.uniform(-0.2, 0.2, size=display_n)
-        x_positions += x_jitter
-
-        # Plot the actual outcomes as scatter points
-        ax1.scatter(
-            x_positions,
-            y_positions,
-            color='blue',
-            alpha=0.7,
-            label=f'Individual outcomes (n={display_n})'
-        )
-
-        # Add a bar for premium with insurance
-        ax1.bar(
-            ['With Insurance'],
-            [fair_premium],
-            color='green',
-            alpha=0.7,
-            width=0.6,
-            label='Insurance premium'
-        )
-
-        # Annotation showing how many people experienced a loss
-        ax1.annotate(
-            f"{num_with_loss} out of {num_policyholders} people\nexperienced a ${CLAIM_AMOUNT:,} loss",
-            xy=(0, CLAIM_AMOUNT / 2),
-            xytext=(0, CLAIM_AMOUNT * 0.7),
-            ha='center',
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8)
-        )
-
-        # Annotation explaining insurance premium
-        ax1.annotate(
-            f"Everyone pays\n${fair_premium:,.0f}",
-            xy=(1, fair_premium / 2),
-            xytext=(1, fair_premium * 1.5),
-            ha='center',
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.8)
-        )
-
-        ax1.set_ylabel('Cost ($)')
-        ax1.set_title(f'Individual Risk Outcomes vs Pooled Outcomes (Seed: {seed})')
-        ax1.grid(axis='y', alpha=0.3)
-        ax1.legend(loc='upper center')
-
-        # Set y-axis limit to ensure visibility of premium
-        ax1.set_ylim(0, CLAIM_AMOUNT * 1.1)
-
-        # Plot 2: Pooled outcome (insurer perspective)
-        ax2.bar(['Premiums Collected', 'Actual Losses'],
-                [pool_premium_total, total_losses],
-                color=['green', 'blue'], alpha=0.7)
-        ax2.set_ylabel('Amount ($)')
-        ax2.set_title(f'Insurer\'s Perspective (Seed: {seed})')
-        ax2.grid(True, alpha=0.3)
-
-        # Add explanatory text
-        performance_text = "Surplus" if pool_performance < 1 else "Deficit"
-        performance_color = "green" if pool_performance < 1 else "red"
-
-        ax2.text(0.5, 0.95,
-                 f"Expected losses: ${pool_premium_total:,.0f}\nActual losses: ${total_losses:,.0f}\n{performance_text}: ${abs(pool_premium_total - total_losses):,.0f}",
-                 transform=ax2.transAxes, ha='center', va='top',
-                 bbox=dict(boxstyle="round,pad=0.5", facecolor="wheat", alpha=0.8))
-
-        # Add annotation for ratio
-        ax2.text(1, total_losses + 0.05 * max(pool_premium_total, total_losses),
-                 f"Actual/Expected: {pool_performance:.2f}", ha='center', color=performance_color)
-
-        # Add a text annotation with the seed value
-        fig.text(0.5, 0.01, f"Simulation Seed: {seed}", ha='center',
-                 fontsize=12, bbox=dict(facecolor='lightgray', alpha=0.5))
-
-        plt.tight_layout()
-        plt.show()
-
-        # Display insurance interpretation
-        print("\nInsurance Interpretation:")
-        print(f"• Simulation Seed: {seed}")
-        print(f"• Individual Risk: Each person has a {accident_probability:.1%} chance of a ${CLAIM_AMOUNT:,.0f} loss.")
+    import matplotlib.pyplot as plt  # Only the notebook path needs pyplot
+    accidents = stats['accidents']
+    individual_costs = stats['individual_costs']
+    x_jitter = stats['x_jitter']
+    num_with_loss = stats['num_with_loss']
+    percent_with_loss = stats['percent_with_loss']
+    fair_premium = stats['fair_premium']
+    total_losses = stats['total_losses']
+    pool_premium_total = stats['pool_premium_total']
+    pool_performance = stats['pool_performance']
+
+    # Create figure
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+
+    # Plot 1: Individual outcomes with improved visualization
+    display_n = min(50, num_policyholders)
+
+    # Create a categorical plot to better show binary outcomes
+    categories = ['No Loss', 'Loss']
+    counts = [display_n - np.sum(accidents[:display_n]), np.sum(accidents[:display_n])]
+
+    # Blue bar chart for individual outcomes
+    ax1.bar(
+        ['Without Insurance'],
+        [CLAIM_AMOUNT],
+        color='lightblue',
+        alpha=0.3,
+        width=0.6,
+        label='Potential loss amount'
+    )
+
+    # Overlay scatter plot showing actual outcomes
+    x_positions = np.ones(display_n) * 0  # All points at x=0 ("Without Insurance")
+    y_positions = individual_costs[:display_n]  # Each person's actual outcome
+
+    # Add jitter to x positions for better visualization
+    x_positions += x_jitter
+
+    # Plot the actual outcomes as scatter points
+    ax1.scatter(
+        x_positions,
+        y_positions,
+        color='blue',
+        alpha=0.7,
+        label=f'Individual outcomes (n={display_n})'
+    )
+
+    # Add a bar for premium with insurance
+    ax1.bar(
+        ['With Insurance'],
+        [fair_premium],
+        color='green',
+        alpha=0.7,
+        width=0.6,
+        label='Insurance premium'
+    )
+
+    # Annotation showing how many people experienced a loss
+    ax1.annotate(
+        f"{num_with_loss} out of {num_policyholders} people\nexperienced a ${CLAIM_AMOUNT:,} loss",
+        xy=(0, CLAIM_AMOUNT / 2),
+        xytext=(0, CLAIM_AMOUNT * 0.7),
+        ha='center',
+        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8)
+    )
+
+    # Annotation explaining insurance premium
+    ax1.annotate(
+        f"Everyone pays\n${fair_premium:,.0f}",
+        xy=(1, fair_premium / 2),
+        xytext=(1, fair_premium * 1.5),
+        ha='center',
+        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgreen", alpha=0.8)
+    )
+
+    ax1.set_ylabel('Cost ($)')
+    ax1.set_title(f'Individual Risk Outcomes vs Pooled Outcomes (Seed: {seed})')
+    ax1.grid(axis='y', alpha=0.3)
+    ax1.legend(loc='upper center')
+
+    # Set y-axis limit to ensure visibility of premium
+    ax1.set_ylim(0, CLAIM_AMOUNT * 1.1)
+
+    # Plot 2: Pooled outcome (insurer perspective)
+    ax2.bar(['Premiums Collected', 'Actual Losses'],
+            [pool_premium_total, total_losses],
+            color=['green', 'blue'], alpha=0.7)
+    ax2.set_ylabel('Amount ($)')
+    ax2.set_title(f'Insurer\'s Perspective (Seed: {seed})')
+    ax2.grid(True, alpha=0.3)
+
+    # Add explanatory text
+    performance_text = "Surplus" if pool_performance < 1 else "Deficit"
+    performance_color = "green" if pool_performance < 1 else "red"
+
+    ax2.text(0.5, 0.95,
+             f"Expected losses: ${pool_premium_total:,.0f}\nActual losses: ${total_losses:,.0f}\n{performance_text}: ${abs(pool_premium_total - total_losses):,.0f}",
+             transform=ax2.transAxes, ha='center', va='top',
+             bbox=dict(boxstyle="round,pad=0.5", facecolor="wheat", alpha=0.8))
+
+    # Add annotation for ratio
+    ax2.text(1, total_losses + 0.05 * max(pool_premium_total, total_losses),
+             f"Actual/Expected: {pool_performance:.2f}", ha='center', color=performance_color)
+
+    # Add a text annotation with the seed value
+    fig.text(0.5, 0.01, f"Simulation Seed: {seed}", ha='center',
+             fontsize=12, bbox=dict(facecolor='lightgray', alpha=0.5))
+
+    plt.tight_layout()
+    plt.show()
+
+    # Display insurance interpretation
+    print("\nInsurance Interpretation:")
+    print(f"• Simulation Seed: {seed}")
+    print(f"• Individual Risk: Each person has a {accident_probability:.1%} chance of a ${CLAIM_AMOUNT:,.0f} loss.")
+    print(
+        f"• Without Insurance: {num_with_loss} people ({percent_with_loss:.1f}%) faced a ${CLAIM_AMOUNT:,.0f} loss in this simulation.")
+    print(f"• With Insurance: Everyone pays a premium of ${fair_premium:.0f}.")
+    print(
+        f"• Risk Pooling Result: The insurer collected ${pool_premium_total:,.0f} and paid ${total_losses:,.0f} in claims.")
+
+    if pool_performance < 1:
         print(
-            f"• Without Insurance: {num_with_loss} people ({percent_with_loss:.1f}%) faced a ${CLAIM_AMOUNT:,.0f} loss in this simulation.")
-        print(f"• With Insurance: Everyone pays a premium of ${fair_premium:.0f}.")
+            f"• This year the insurance pool had a ${abs(pool_premium_total - total_losses):,.0f} surplus (collected more than paid out).")
+        print(f"• The surplus can be held as capital to handle future years when claims exceed premiums.")
+    else:
         print(
-            f"• Risk Pooling Result: The insurer collected ${pool_premium_total:,.0f} and paid ${total_losses:,.0f} in claims.")
-
-        if pool_performance < 1:
-            print(
-                f"• This year the insurance pool had a ${abs(pool_premium_total - total_losses):,.0f} surplus (collected more than paid out).")
-            print(f"• The surplus can be held as capital to handle future years when claims exceed premiums.")
-        else:
-            print(
-                f"• This year the insurance pool had a ${abs(pool_premium_total - total_losses):,.0f} deficit (paid out more than collected).")
-            print(f"• The deficit must be covered by the insurer's capital reserves.")
-
-        print(f"\n• Key Insight: As the number of policyholders increases, the 'Actual/Expected' ratio approaches 1.0,")
-        print(f"  making the insurance pool's results more predictable and stable.")
\ No newline at end of file
+            f"• This year the insurance pool had a ${abs(pool_premium_total - total_losses):,.0f} deficit (paid out more than collected).")
+        print(f"• The deficit must be covered by the insurer's capital reserves.")
+
+    print(f"\n• Key Insight: As the number of policyholders increases, the 'Actual/Expected' ratio approaches 1.0,")
+    print(f"  making the insurance pool's results more predictable and stable.")
\ No newline at end of file